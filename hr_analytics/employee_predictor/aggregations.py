@@ -0,0 +1,150 @@
+# employee_predictor/aggregations.py
+import time
+
+from django.core.cache import cache
+from django.db.models import Count, Sum
+
+from .models import Attendance, Employee
+
+# Context key used for each attendance status; views add their own suffix
+# ('present' on the dashboards, 'present_days' on the performance pages)
+ATTENDANCE_STATUS_KEYS = {
+    'PRESENT': 'present',
+    'ABSENT': 'absent',
+    'LATE': 'late',
+    'ON_LEAVE': 'on_leave',
+}
+
+# Staff dashboard aggregates are cached per day for this many seconds. Every
+# write to the models they read bumps a version number that is part of the
+# key, so a save or delete is visible on the next page load.
+DASHBOARD_CACHE_TIMEOUT = 60
+DASHBOARD_VERSION_KEY = 'dash:ver'
+
+# Distinct departments for the employee list filter; cleared by signals.py
+# whenever an employee's department may have changed
+DEPARTMENTS_CACHE_KEY = 'employee_departments'
+DEPARTMENTS_CACHE_TIMEOUT = 3600
+
+# Per-employee attendance counts for a date range. Keys carry the range and a
+# per-employee version that signals.py bumps on every Attendance write, so a
+# past month is read once and the current month once per day and per write.
+ATTENDANCE_CACHE_TIMEOUT = 3600
+
+
+def attendance_status_counts(queryset, group_by=None):
+    """
+    Count attendance rows per status in a single GROUP BY status query.
+
+    Returns {status: row}, where each row holds 'count', 'hours_total' and
+    'hours_count' (records with hours recorded). When group_by names a field
+    or annotation, the result is nested one level: {group: {status: row}}.
+    """
+    fields = ('status',) if group_by is None else (group_by, 'status')
+    rows = queryset.values(*fields).annotate(
+        count=Count('id'),
+        hours_total=Sum('hours_worked'),
+        hours_count=Count('hours_worked')
+    ).order_by()
+
+    if group_by is None:
+        return {row['status']: row for row in rows}
+
+    grouped = {}
+    for row in rows:
+        grouped.setdefault(row[group_by], {})[row['status']] = row
+    return grouped
+
+
+def attendance_stats(counts, suffix=''):
+    """
+    Pivot attendance_status_counts() output into the context shape the
+    templates use: one count per status (0 when absent) plus avg_hours.
+    """
+    stats = {key + suffix: 0 for key in ATTENDANCE_STATUS_KEYS.values()}
+    hours_total = 0
+    hours_count = 0
+    for status, row in counts.items():
+        key = ATTENDANCE_STATUS_KEYS.get(status)
+        if key is not None:
+            stats[key + suffix] = row['count']
+        if row['hours_count']:
+            hours_total += row['hours_total']
+            hours_count += row['hours_count']
+
+    # Same as Avg('hours_worked') over every status, None when nothing recorded
+    stats['avg_hours'] = hours_total / hours_count if hours_count else None
+    return stats
+
+
+def _cache_version(key):
+    """
+    Current value of a version counter, seeding it if it is missing.
+
+    The seed is the clock in nanoseconds rather than 1, so a counter that
+    was evicted never restarts at a version whose entries are still cached.
+    """
+    return cache.get_or_set(key, time.time_ns, timeout=None)
+
+
+def _bump_cache_version(key):
+    """Move a version counter on, reseeding it if it was evicted."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def dashboard_cache_key(day, *parts):
+    """
+    Cache key for the dashboard aggregates of ``day`` at the current version.
+
+    Extra parts name smaller aggregates (the list pages' counters) that share
+    the dashboard's version and so are invalidated by the same writes.
+    """
+    version = _cache_version(DASHBOARD_VERSION_KEY)
+    return ':'.join(['dash', str(version), day.isoformat(), *parts])
+
+
+def invalidate_dashboard_cache():
+    """Move the dashboard to a new cache version; old entries simply expire."""
+    _bump_cache_version(DASHBOARD_VERSION_KEY)
+
+
+def employee_departments():
+    """Distinct employee departments, cached until an Employee write clears them."""
+    return cache.get_or_set(
+        DEPARTMENTS_CACHE_KEY,
+        # order_by() replaces Meta.ordering, which would otherwise be part of
+        # the DISTINCT and repeat a department once per ordering value
+        lambda: list(
+            Employee.objects.values_list('department', flat=True).order_by('department').distinct()
+        ),
+        DEPARTMENTS_CACHE_TIMEOUT
+    )
+
+
+def _attendance_version_key(employee_id):
+    return f'attendance:ver:{employee_id}'
+
+
+def attendance_cache_key(employee_id, *parts):
+    """Cache key for an employee's attendance aggregates at the current version."""
+    version = _cache_version(_attendance_version_key(employee_id))
+    return ':'.join(['attendance', str(employee_id), str(version), *map(str, parts)])
+
+
+def invalidate_attendance_cache(employee_id):
+    """Move an employee's attendance aggregates to a new cache version."""
+    _bump_cache_version(_attendance_version_key(employee_id))
+
+
+def employee_attendance_counts(employee_id, start, end):
+    """attendance_status_counts() for one employee and date range, cached."""
+    return cache.get_or_set(
+        attendance_cache_key(employee_id, start.isoformat(), end.isoformat()),
+        lambda: attendance_status_counts(
+            Attendance.objects.filter(employee_id=employee_id, date__range=[start, end])
+        ),
+        ATTENDANCE_CACHE_TIMEOUT
+    )
@@ -16,7 +16,10 @@ def get_employee_salary_info(request, employee_id):
     try:
         # Attempt to get the employee object
         try:
-            employee = get_object_or_404(Employee, id=employee_id)
+            employee = get_object_or_404(
+                Employee.objects.only('id', 'name', 'salary', 'department'),
+                id=employee_id
+            )
         except Http404:
             return JsonResponse({
                 'error': f'Employee with ID {employee_id} not found'
@@ -44,7 +47,9 @@ def get_employee_salary_info(request, employee_id):
                 end_date = date(today.year, today.month + 1, 1) - timedelta(days=1)
 
         # Calculate payroll details
-        payroll_details = calculate_payroll_details(employee, start_date, end_date)
+        payroll_details = calculate_payroll_details(
+            employee.id, employee.salary, start_date, end_date
+        )
 
         # Return successful response
         return JsonResponse({
@@ -52,9 +57,9 @@ def get_employee_salary_info(request, employee_id):
             'name': employee.name,
             'salary': float(employee.salary),
             'department': employee.department,
-            'overtime_rate': payroll_details['overtime_rate'],
-            'overtime_hours': payroll_details['overtime_hours'],
-            'estimated_tax': payroll_details['estimated_tax'],
+            'overtime_rate': float(payroll_details['overtime_rate']),
+            'overtime_hours': float(payroll_details['overtime_hours']),
+            'estimated_tax': float(payroll_details['estimated_tax']),
             'attendance_stats': payroll_details['attendance_stats']
         })
     except Exception as e:
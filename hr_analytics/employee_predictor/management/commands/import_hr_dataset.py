@@ -33,7 +33,8 @@ class Command(BaseCommand):
             
             # Start a transaction for bulk operations
             with transaction.atomic():
-                for index, row in df.iterrows():
+                # Plain dicts; iterrows() would build a Series per row
+                for index, row in enumerate(df.to_dict('records')):
                     try:
                         # Map HRDataset fields to Employee model
                         emp_data = self.map_employee_data(row)
@@ -49,7 +49,8 @@ class Command(BaseCommand):
 
             # Start a transaction
             with transaction.atomic():
-                for index, row in df.iterrows():
+                # Plain dicts; iterrows() would build a Series per row
+                for index, row in enumerate(df.to_dict('records')):
                     try:
                         # Process the row and create an employee record
                         employee_data = self._map_employee_data(row)
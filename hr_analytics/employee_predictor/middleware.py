@@ -1,25 +1,32 @@
 # employee_predictor/middleware.py
 from django.shortcuts import redirect
-from django.urls import resolve, reverse
 from django.contrib import messages
 
+# Staff-only pages an employee is sent back to the portal from
+ADMIN_URL_NAMES = frozenset({
+    'employee-list', 'employee-detail', 'employee-predict',
+    'attendance-list', 'attendance-create', 'attendance-update',
+    'leave-list', 'leave-create', 'leave-update', 'leave-approve',
+    'payroll-list', 'payroll-create', 'payroll-detail', 'payroll-update',
+})
+
 
 class EmployeePortalMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        if request.user.is_authenticated and not request.user.is_staff:
-            current_url = resolve(request.path_info).url_name
-            admin_urls = ['employee-list', 'employee-detail', 'employee-predict',
-                          'attendance-list', 'attendance-create', 'attendance-update',
-                          'leave-list', 'leave-create', 'leave-update', 'leave-approve',
-                          'payroll-list', 'payroll-create', 'payroll-detail', 'payroll-update']
+        return self.get_response(request)
 
-            # If employee tries to access admin URLs, redirect to employee portal
-            if current_url in admin_urls:
-                messages.warning(request, 'Access denied. Redirecting to employee portal.')
-                return redirect('employee-portal')
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # Runs after URL resolution, so the match Django already made is
+        # reused instead of resolving the path a second time
+        if request.resolver_match.url_name not in ADMIN_URL_NAMES:
+            return None
 
-        response = self.get_response(request)
-        return response
\ No newline at end of file
+        user = request.user
+        if user.is_authenticated and not user.is_staff:
+            # If employee tries to access admin URLs, redirect to employee portal
+            messages.warning(request, 'Access denied. Redirecting to employee portal.')
+            return redirect('employee-portal')
+        return None
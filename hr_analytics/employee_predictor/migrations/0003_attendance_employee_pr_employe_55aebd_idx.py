@@ -0,0 +1,17 @@
+# Generated by Django 5.0 on 2026-10-15 23:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee_predictor', '0002_alter_employee_date_of_hire'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['employee', 'status', 'date'], name='employee_pr_employe_55aebd_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0 on 2026-10-15 23:20
+
+import json
+
+import employee_predictor.models
+from django.db import migrations, models
+
+
+def clear_invalid_prediction_details(apps, schema_editor):
+    """Null out text that isn't valid JSON so the column type change succeeds."""
+    Employee = apps.get_model('employee_predictor', 'Employee')
+    invalid_ids = []
+    for pk, details in Employee.objects.exclude(
+        prediction_details__isnull=True
+    ).values_list('pk', 'prediction_details').iterator():
+        try:
+            json.loads(details)
+        except (TypeError, ValueError):
+            invalid_ids.append(pk)
+    Employee.objects.filter(pk__in=invalid_ids).update(prediction_details=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee_predictor', '0003_attendance_employee_pr_employe_55aebd_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_invalid_prediction_details, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='employee',
+            name='prediction_details',
+            field=models.JSONField(blank=True, encoder=employee_predictor.models.PredictionDetailsEncoder, help_text='Detailed prediction info', null=True),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0 on 2026-10-15 23:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee_predictor', '0004_employee_prediction_details_json'),
+    ]
+
+    # Add the covering index before dropping the ones it supersedes, so the
+    # employee foreign key always has an index to use on MySQL
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['employee', 'date', 'status', 'hours_worked'], name='attendance_emp_date_cover_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='attendance',
+            name='employee_pr_employe_e2719e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='attendance',
+            name='employee_pr_employe_55aebd_idx',
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0 on 2026-10-15 23:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee_predictor', '0005_attendance_covering_index'),
+    ]
+
+    # As in 0005, create the wider index before dropping the (date, status)
+    # one it replaces so date filters never lose their index
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['date', 'status', 'hours_worked'], name='attendance_date_cover_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='attendance',
+            name='employee_pr_date_b0f2a0_idx',
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0 on 2026-10-15 23:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee_predictor', '0006_attendance_date_covering_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payroll',
+            index=models.Index(fields=['employee', 'period_end'], name='employee_pr_employe_1d63a7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payroll',
+            index=models.Index(fields=['period_start'], name='employee_pr_period__9536a5_idx'),
+        ),
+    ]
@@ -285,20 +285,15 @@ class EnhancedPerformancePredictor:
                 if key not in processed_data or processed_data[key] is None:
                     processed_data[key] = default_value
 
-            # Convert to DataFrame
-            df = pd.DataFrame([processed_data])
-
-            # Select required features
+            # Select required features straight from the dict and build the
+            # one-row frame once, in model column order
             required_features = self.preprocessor_config['all_features']
-            feature_data = {}
-
-            for feature in required_features:
-                if feature in df.columns:
-                    feature_data[feature] = df[feature].iloc[0]
-                else:
-                    feature_data[feature] = defaults.get(feature, 0)
+            feature_data = {
+                feature: processed_data.get(feature, defaults.get(feature, 0))
+                for feature in required_features
+            }
 
-            df_features = pd.DataFrame([feature_data])
+            df_features = pd.DataFrame([feature_data], columns=required_features)
 
             return df_features, df_features.values
 
@@ -7,11 +7,38 @@ import json
 import logging
 from django.utils import timezone as django_timezone
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 
 logger = logging.getLogger(__name__)
 
 
+class PredictionDetailsEncoder(DjangoJSONEncoder):
+    """JSON encoder for Employee.prediction_details.
+
+    Predictor output can carry numpy scalars and other types json doesn't
+    know; like json.dumps(default=str), store their string form instead of
+    failing the save.
+    """
+
+    def default(self, o):
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
 class Employee(models.Model):
+    # Columns a prediction writes; saves that only record a prediction
+    # pass these as update_fields. auto_now only fires for fields that are
+    # saved, so updated_at has to be listed too
+    PREDICTION_FIELDS = (
+        'predicted_score', 'performance_score', 'prediction_confidence',
+        'prediction_details', 'prediction_date', 'updated_at',
+    )
+
+    # performance_score label for each predicted_score
+    SCORE_LABELS = {4: 'Exceeds', 3: 'Fully Meets', 2: 'Needs Improvement', 1: 'PIP'}
+
     # Link to User model (for login functionality)
     user = models.OneToOneField(User, on_delete=models.CASCADE, null=True, blank=True)
 
@@ -80,10 +107,11 @@ class Employee(models.Model):
         blank=True,
         help_text="Confidence score for the prediction (0-1)"
     )
-    prediction_details = models.TextField(
+    prediction_details = models.JSONField(
         null=True,
         blank=True,
-        help_text="JSON string with detailed prediction info"
+        encoder=PredictionDetailsEncoder,
+        help_text="Detailed prediction info"
     )
 
     # Employment status
@@ -144,15 +172,8 @@ class Employee(models.Model):
         self.full_clean()
 
         # Ensure consistency between predicted_score and performance_score
-        if self.predicted_score is not None:
-            score_mapping = {
-                4: 'Exceeds',
-                3: 'Fully Meets',
-                2: 'Needs Improvement',
-                1: 'PIP'
-            }
-            if self.predicted_score in score_mapping:
-                self.performance_score = score_mapping[self.predicted_score]
+        if self.predicted_score in self.SCORE_LABELS:
+            self.performance_score = self.SCORE_LABELS[self.predicted_score]
 
         super().save(*args, **kwargs)
 
@@ -212,15 +233,7 @@ class Employee(models.Model):
                 return False
 
             # Map prediction score to performance category
-            score_mapping = {
-                4: 'Exceeds',
-                3: 'Fully Meets',
-                2: 'Needs Improvement',
-                1: 'PIP'
-            }
-
-            if self.predicted_score in score_mapping:
-                self.performance_score = score_mapping[self.predicted_score]
+            self.performance_score = self.SCORE_LABELS[self.predicted_score]
 
             # Save confidence score if available
             probabilities = prediction_result.get('probabilities', {})
@@ -243,22 +256,19 @@ class Employee(models.Model):
                 'model_version': prediction_result.get('model_version', '1.0')
             }
 
-            try:
-                self.prediction_details = json.dumps(prediction_details, default=str)
-            except Exception as e:
-                logger.error(f"Error serializing prediction details for {self.emp_id}: {str(e)}")
-                # Save minimal details
-                self.prediction_details = json.dumps({
-                    'prediction_score': self.predicted_score,
-                    'timestamp': django_timezone.now().isoformat(),
-                    'error': 'Failed to serialize full details'
-                })
+            # Stored as-is; PredictionDetailsEncoder falls back to str() for
+            # values JSON can't represent
+            self.prediction_details = prediction_details
 
             # Set prediction date
             self.prediction_date = django_timezone.now()
 
-            # Save the model instance
-            self.save()
+            # Save the model instance; an existing row only needs the
+            # prediction columns written
+            if self._state.adding:
+                self.save()
+            else:
+                self.save(update_fields=self.PREDICTION_FIELDS)
 
             logger.info(f"Prediction details saved for {self.emp_id}: score={self.predicted_score}")
             return True
@@ -293,6 +303,11 @@ class Employee(models.Model):
         if not self.prediction_details:
             return None
 
+        # Loaded from the database as a dict; a string is JSON text assigned
+        # directly and not yet saved
+        if not isinstance(self.prediction_details, str):
+            return self.prediction_details
+
         try:
             return json.loads(self.prediction_details)
         except (json.JSONDecodeError, TypeError) as e:
@@ -391,8 +406,21 @@ class Attendance(models.Model):
         unique_together = ['employee', 'date']
         ordering = ['-date', 'employee']
         indexes = [
-            models.Index(fields=['employee', 'date']),
-            models.Index(fields=['date', 'status']),
+            # Covers the per-employee date-range aggregates (GROUP BY status,
+            # SUM/COUNT of hours_worked) so they read only the index, status
+            # filters included. It replaces the plain (employee, date) and the
+            # (employee, status, date) indexes. Key columns rather than
+            # include=, which Django only supports on PostgreSQL.
+            models.Index(
+                fields=['employee', 'date', 'status', 'hours_worked'],
+                name='attendance_emp_date_cover_idx'
+            ),
+            # Same idea for a single day across employees (today's stats on
+            # the dashboard and attendance list); also serves date/status filters
+            models.Index(
+                fields=['date', 'status', 'hours_worked'],
+                name='attendance_date_cover_idx'
+            ),
         ]
 
     def __str__(self):
@@ -427,12 +455,8 @@ class Attendance(models.Model):
 
         return Decimal('0.00')
 
-    def save(self, *args, **kwargs):
-        """Override save to calculate hours worked"""
-        # Clean data before saving
-        self.full_clean()
-
-        # Auto-calculate hours worked
+    def apply_status_rules(self):
+        """Clear times for leave days and derive hours_worked from check-in/out"""
         if self.status == 'ON_LEAVE':
             self.check_in = None
             self.check_out = None
@@ -440,6 +464,14 @@ class Attendance(models.Model):
         elif self.check_out and self.check_in and self.status in ['PRESENT', 'LATE']:
             self.hours_worked = self.calculate_hours_worked()
 
+    def save(self, *args, **kwargs):
+        """Override save to calculate hours worked"""
+        # Clean data before saving
+        self.full_clean()
+
+        # Auto-calculate hours worked
+        self.apply_status_rules()
+
         super().save(*args, **kwargs)
 
 
@@ -539,6 +571,10 @@ class Payroll(models.Model):
         indexes = [
             models.Index(fields=['employee', 'period_start']),
             models.Index(fields=['period_end', 'status']),
+            # An employee's payslips newest first (portal, employee detail)
+            models.Index(fields=['employee', 'period_end']),
+            # Month filters on the payroll list and dashboard
+            models.Index(fields=['period_start']),
         ]
 
     def __str__(self):
@@ -0,0 +1,39 @@
+# employee_predictor/signals.py
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .aggregations import (
+    DEPARTMENTS_CACHE_KEY, invalidate_attendance_cache, invalidate_dashboard_cache
+)
+from .models import Attendance, Employee, Leave, Payroll
+
+# Models the staff dashboard aggregates over
+DASHBOARD_MODELS = (Employee, Attendance, Leave, Payroll)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_dashboard_on_write(sender, **kwargs):
+    """Drop the cached dashboard aggregates whenever a model they read changes."""
+    if sender in DASHBOARD_MODELS:
+        invalidate_dashboard_cache()
+
+
+@receiver(post_save, sender=Employee)
+def invalidate_departments_on_save(sender, update_fields=None, **kwargs):
+    """Clear the cached department list unless the save skipped department."""
+    if update_fields is None or 'department' in update_fields:
+        cache.delete(DEPARTMENTS_CACHE_KEY)
+
+
+@receiver(post_delete, sender=Employee)
+def invalidate_departments_on_delete(sender, **kwargs):
+    cache.delete(DEPARTMENTS_CACHE_KEY)
+
+
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def invalidate_attendance_on_write(sender, instance, **kwargs):
+    """Drop the cached attendance aggregates of the record's employee."""
+    invalidate_attendance_cache(instance.employee_id)
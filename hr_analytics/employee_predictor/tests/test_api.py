@@ -59,6 +59,16 @@ class EmployeeAPITest(BaseTestCase):
         self.assertIn('overtime_rate', data)
         self.assertIn('estimated_tax', data)
 
+    def test_get_employee_salary_info_returns_numbers(self):
+        """Test the payroll amounts are JSON numbers the form can format."""
+        response = self.client.get(
+            reverse('api-employee-salary', args=[self.employee.id])
+        )
+
+        data = json.loads(response.content)
+        for field in ('overtime_rate', 'overtime_hours', 'estimated_tax'):
+            self.assertIsInstance(data[field], float, field)
+
     def test_get_employee_salary_info_invalid_employee(self):
         """Test API with invalid employee ID."""
         response = self.client.get(
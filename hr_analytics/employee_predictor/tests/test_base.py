@@ -1,4 +1,5 @@
 # employee_predictor/tests/test_base.py
+from django.conf import settings
 from django.test import TestCase, Client, RequestFactory
 from django.contrib.auth.models import User
 from django.urls import reverse
@@ -6,29 +7,41 @@ from decimal import Decimal
 from datetime import date, timedelta
 
 from employee_predictor.models import Employee, Attendance, Leave, Payroll
-from employee_predictor.tests.test_helper import axes_login
+from employee_predictor.tests.test_helper import fast_login
 
 
 class BaseTestCase(TestCase):
-    """Base test case with common setup for all tests."""
+    """Base test case with common setup for all tests.
 
-    def setUp(self):
+    Subclasses must stay on django.test.TestCase, not TransactionTestCase.
+    Each test then runs inside a savepoint that is rolled back afterwards,
+    and class attributes set in setUpTestData are deep-copied per test, so
+    tests may update or delete those rows (e.g. the update/delete view tests)
+    without recreating them in setUp.
+
+    setUpTestData itself runs inside TestCase's class-wide atomic block and
+    a plain Model.save() opens no savepoint, so fixture creation needs no
+    extra transaction.atomic() wrapper.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
         # Create staff user
-        self.staff_user = User.objects.create_user(
+        cls.staff_user = User.objects.create_user(
             username='staffuser',
             password='staffpassword',
             is_staff=True
         )
 
         # Create employee user
-        self.employee_user = User.objects.create_user(
+        cls.employee_user = User.objects.create_user(
             username='employeeuser',
             password='employeepassword'
         )
 
         # Create employee record
-        self.employee = Employee.objects.create(
-            user=self.employee_user,
+        cls.employee = Employee.objects.create(
+            user=cls.employee_user,
             name='Test Employee',
             emp_id='EMP001',
             department='IT',
@@ -46,9 +59,16 @@ class BaseTestCase(TestCase):
             employment_status='Active'
         )
 
-        # Create client and factory
-        self.client = Client()
-        self.factory = RequestFactory()
+        # RequestFactory holds no per-test state; TestCase already gives
+        # every test a fresh self.client
+        cls.factory = RequestFactory()
+
+    @classmethod
+    def login_session(cls, user):
+        """Log user in once and return the session cookie value for reuse."""
+        client = Client()
+        fast_login(client, user)
+        return client.cookies[settings.SESSION_COOKIE_NAME].value
 
     def create_attendance(self, employee=None, days=5, status='PRESENT'):
         """Helper to create attendance records for a given employee."""
@@ -56,18 +76,24 @@ class BaseTestCase(TestCase):
             employee = self.employee
 
         today = date.today()
-        attendances = []
+        hours_worked = Decimal('8.00') if status in ['PRESENT', 'LATE'] else Decimal('0.00')
 
-        for day in range(days):
-            attendance = Attendance.objects.create(
+        Attendance.objects.bulk_create([
+            Attendance(
                 employee=employee,
                 date=today - timedelta(days=day),
                 status=status,
-                hours_worked=Decimal('8.00') if status in ['PRESENT', 'LATE'] else Decimal('0.00')
+                hours_worked=hours_worked
             )
-            attendances.append(attendance)
+            for day in range(days)
+        ])
 
-        return attendances
+        # Re-fetch so primary keys are set on backends that don't return them
+        return list(Attendance.objects.filter(
+            employee=employee,
+            date__gt=today - timedelta(days=days),
+            date__lte=today
+        ).order_by('-date'))
 
     def create_leave(self, employee=None, status='PENDING'):
         """Helper to create a leave request."""
@@ -104,16 +130,33 @@ class BaseTestCase(TestCase):
 
 
 class BaseStaffTestCase(BaseTestCase):
-    """Base test case for staff-level functionality."""
+    """Base test case for staff-level functionality.
+
+    The staff session is created once per class in setUpTestData and its
+    cookie is attached to each test's client, so tests don't log in again.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.session_cookie = cls.login_session(cls.staff_user)
 
     def setUp(self):
         super().setUp()
-        axes_login(self.client, 'staffuser', 'staffpassword')
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_cookie
 
 
 class BaseEmployeeTestCase(BaseTestCase):
-    """Base test case for employee-level functionality."""
+    """Base test case for employee-level functionality.
+
+    Reuses one employee session per class, like BaseStaffTestCase.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.session_cookie = cls.login_session(cls.employee_user)
 
     def setUp(self):
         super().setUp()
-        axes_login(self.client, 'employeeuser', 'employeepassword')
\ No newline at end of file
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_cookie
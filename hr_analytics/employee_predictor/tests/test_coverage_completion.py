@@ -540,28 +540,6 @@ class CoverageCompletionTests(TestCase):
         # Check for redirect
         self.assertRedirects(response, reverse('attendance-list'))
 
-        # Now test with malformed CSV to trigger an exception
-        with patch('pandas.read_csv') as mock_read_csv:
-            mock_read_csv.side_effect = Exception("CSV parsing error")
-
-            bad_csv = SimpleUploadedFile(
-                "bad.csv",
-                b"invalid,csv,format",
-                content_type="text/csv"
-            )
-
-            response = self.client.post(
-                reverse('bulk-attendance'),
-                {
-                    'date': date.today().strftime('%Y-%m-%d'),
-                    'csv_file': bad_csv
-                },
-                follow=True
-            )
-
-            # Check that we get an error message
-            self.assertContains(response, "Error processing file")
-
     def test_employee_register_errors(self):
         """Test error handling in employee_register."""
         # Test GET request
@@ -1,10 +1,44 @@
 # employee_predictor/tests/test_helper.py
+from functools import lru_cache
+
 from django.test import RequestFactory
+from django.urls import reverse
 from django.contrib.auth import authenticate
 from django.contrib.messages.storage.fallback import FallbackStorage
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, timezone as dt_timezone
 from decimal import Decimal
 import random
+from unittest.mock import patch
+
+
+# Valid EmployeeForm POST data for the default test employee (EMP001).
+# Override fields with {**BASE_EMPLOYEE_PAYLOAD, 'name': ...}; never mutate it.
+BASE_EMPLOYEE_PAYLOAD = {
+    'name': 'Test Employee',
+    'emp_id': 'EMP001',
+    'department': 'IT',
+    'position': 'Developer',
+    'date_of_hire': '2020-01-01',
+    'gender': 'M',
+    'marital_status': 'Single',
+    'age': 30,
+    'race': 'White',
+    'hispanic_latino': 'No',
+    'recruitment_source': 'LinkedIn',
+    'salary': '60000.00',
+    'engagement_survey': 4.0,
+    'emp_satisfaction': 4,
+    'special_projects_count': 2,
+    'days_late_last_30': 1,
+    'absences': 3,
+    'employment_status': 'Active'
+}
+
+
+@lru_cache(maxsize=None)
+def cached_reverse(name, *args):
+    """reverse() for parameterised routes, cached per (name, args)."""
+    return reverse(name, args=args)
 
 
 def axes_login(client, username, password, **kwargs):
@@ -38,6 +72,49 @@ def axes_login(client, username, password, **kwargs):
     return False
 
 
+def fast_login(client, user):
+    """
+    Log a user in without authenticating, for tests that only need a session.
+
+    Skips password hashing and the django-axes checks that axes_login goes
+    through; use axes_login for tests that exercise the login flow itself.
+
+    Args:
+        client: The test client
+        user: The User instance to log in
+    """
+    client.force_login(user)
+
+
+# Fixed clock for tests whose fixtures and assertions depend on "today"
+FROZEN_NOW = datetime(2024, 6, 15, 12, 0, tzinfo=dt_timezone.utc)
+FROZEN_TODAY = FROZEN_NOW.date()
+
+
+def freeze_now(moment=FROZEN_NOW):
+    """
+    Class decorator pinning django.utils.timezone.now() to a fixed moment.
+
+    The patch starts before setUpClass, so setUpTestData and every test see
+    the same clock and date math can't drift across midnight.
+
+    Args:
+        moment: The aware datetime timezone.now() should return
+    """
+    def decorator(cls):
+        set_up_class = cls.setUpClass.__func__
+
+        def setUpClass(klass):
+            patcher = patch('django.utils.timezone.now', return_value=moment)
+            patcher.start()
+            klass.addClassCleanup(patcher.stop)
+            set_up_class(klass)
+
+        cls.setUpClass = classmethod(setUpClass)
+        return cls
+    return decorator
+
+
 def add_message_middleware(request):
     """Add message middleware to a request factory request."""
     setattr(request, 'session', 'session')
@@ -2,6 +2,7 @@
 from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.contrib import messages
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
 from datetime import date, timedelta
@@ -10,7 +11,6 @@ from unittest.mock import patch, MagicMock
 from django.db import transaction
 from employee_predictor.tests.test_helper import axes_login
 from employee_predictor.models import Employee, Attendance, Leave, Payroll
-from django.db import connection
 
 class EmployeeWorkflowTest(TestCase):
     """Test complete employee lifecycle workflow."""
@@ -243,38 +243,12 @@ class EmployeeWorkflowTest(TestCase):
         # Get a fresh instance of the employee
         employee = Employee.objects.get(emp_id='SIMPLE101')
 
-        # First approach: Direct database update
-        try:
-            # Use transaction to ensure the update is committed
-            with transaction.atomic():
-                # Update directly via ORM
-                Employee.objects.filter(id=employee.id).update(
-                    employment_status='Voluntarily Terminated'
-                )
+        Employee.objects.filter(id=employee.id).update(
+            employment_status='Voluntarily Terminated'
+        )
 
-                # Get a completely fresh instance to verify the change
-                employee = Employee.objects.get(id=employee.id)
-
-                # Log the status to help with debugging
-                print(f"Updated employee status: {employee.employment_status}")
-        except Exception as e:
-            # Log any exceptions that might occur
-            print(f"Error during direct update: {str(e)}")
-
-            # Fallback approach if the first method fails
-            try:
-                # Connect to the database directly for a raw update
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        "UPDATE employee_predictor_employee SET employment_status = %s WHERE id = %s",
-                        ['Voluntarily Terminated', employee.id]
-                    )
-
-                # Refresh from database
-                employee = Employee.objects.get(id=employee.id)
-                print(f"Updated using raw SQL: {employee.employment_status}")
-            except Exception as e2:
-                print(f"Error during raw SQL update: {str(e2)}")
+        # Reload only the updated column to verify the change
+        employee.refresh_from_db(fields=['employment_status'])
 
         # Check employment status was updated
         self.assertEqual(employee.employment_status, 'Voluntarily Terminated')
@@ -317,20 +291,8 @@ class BulkOperationsTest(TestCase):
         self.client = Client()
         axes_login(self.client, 'admin', 'adminpassword')
 
-    @patch('employee_predictor.views.pd.read_csv')
-    def test_bulk_attendance_upload(self, mock_read_csv):
+    def test_bulk_attendance_upload(self):
         """Test bulk attendance upload functionality."""
-        # Create mock DataFrame
-        import pandas as pd
-        mock_df = pd.DataFrame({
-            'employee_id': [self.employees[0].emp_id, self.employees[1].emp_id],
-            'status': ['PRESENT', 'PRESENT'],
-            'check_in': ['09:00', '08:30'],
-            'check_out': ['17:00', '16:30'],
-            'notes': ['Test 1', 'Test 2']
-        })
-        mock_read_csv.return_value = mock_df
-
         # Create CSV file
         csv_content = b"employee_id,status,check_in,check_out,notes\nBULK001,PRESENT,09:00,17:00,Test 1\nBULK002,PRESENT,08:30,16:30,Test 2"
         upload_file = SimpleUploadedFile('test.csv', csv_content, content_type='text/csv')
@@ -348,17 +310,64 @@ class BulkOperationsTest(TestCase):
         # Should redirect to attendance list
         self.assertRedirects(response, reverse('attendance-list'))
 
-        # For now, let's just assert the response status is 200 rather than counting records
-        # This way the test can pass while we debug the actual issue
         self.assertEqual(response.status_code, 200)
 
-    @patch('employee_predictor.views.pd.read_csv')
-    def test_bulk_attendance_with_error(self, mock_read_csv):
-        """Test error handling in bulk attendance upload."""
-        # Mock read_csv to raise an exception
-        mock_read_csv.side_effect = Exception("CSV error")
+        records = Attendance.objects.filter(date=date.today()).order_by('employee__emp_id')
+        self.assertEqual(records.count(), 2)
+        self.assertEqual(records[0].hours_worked, Decimal('8.00'))
+        self.assertEqual(records[1].notes, 'Test 2')
 
-        # Create CSV file
+    def test_bulk_attendance_upload_updates_existing(self):
+        """Existing records are updated in place and unknown employees are reported."""
+        Attendance.objects.create(
+            employee=self.employees[0], date=date.today(), status='ABSENT'
+        )
+        csv_content = (
+            b"employee_id,status,check_in,check_out\n"
+            b"BULK001,late,09:30,17:30\n"
+            b"BULK002,on_leave,09:00,17:00\n"
+            b"MISSING,PRESENT,09:00,17:00\n"
+        )
+        upload_file = SimpleUploadedFile('test.csv', csv_content, content_type='text/csv')
+
+        with self.assertNumQueries(8):
+            response = self.client.post(
+                reverse('bulk-attendance'),
+                {'date': date.today().strftime('%Y-%m-%d'), 'csv_file': upload_file}
+            )
+
+        self.assertRedirects(response, reverse('attendance-list'), fetch_redirect_response=False)
+        sent = [m.message for m in messages.get_messages(response.wsgi_request)]
+        self.assertEqual(sent, [
+            'Successfully processed 2 attendance records.',
+            'Failed to process 1 records: line 4: Employee MISSING not found',
+        ])
+        updated = Attendance.objects.get(employee=self.employees[0], date=date.today())
+        self.assertEqual(updated.status, 'LATE')
+        self.assertEqual(updated.hours_worked, Decimal('8.00'))
+        on_leave = Attendance.objects.get(employee=self.employees[1], date=date.today())
+        self.assertIsNone(on_leave.check_in)
+        self.assertEqual(on_leave.hours_worked, Decimal('0.00'))
+        self.assertEqual(Attendance.objects.count(), 2)
+
+    def test_bulk_attendance_upload_queries_independent_of_rows(self):
+        """Employees are resolved with one IN query however many rows there are."""
+        csv_content = b"employee_id,status,check_in,check_out\n" + b"".join(
+            f"{employee.emp_id},PRESENT,09:00,17:00\n".encode() for employee in self.employees
+        )
+        upload_file = SimpleUploadedFile('test.csv', csv_content, content_type='text/csv')
+
+        # Session, user, employees, existing records, and one INSERT in a savepoint
+        with self.assertNumQueries(7):
+            self.client.post(
+                reverse('bulk-attendance'),
+                {'date': date.today().strftime('%Y-%m-%d'), 'csv_file': upload_file}
+            )
+        self.assertEqual(Attendance.objects.filter(date=date.today()).count(), len(self.employees))
+
+    def test_bulk_attendance_with_error(self):
+        """Test error handling in bulk attendance upload."""
+        # Create CSV file without the required columns
         csv_content = b"invalid,header\ndata,values"
         upload_file = SimpleUploadedFile('invalid.csv', csv_content, content_type='text/csv')
 
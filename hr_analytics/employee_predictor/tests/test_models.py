@@ -5,44 +5,77 @@ from django.utils import timezone
 from datetime import date, timedelta, time
 from decimal import Decimal
 import json
-from django.db import transaction
+from django.contrib.auth.hashers import make_password
 from employee_predictor.models import Employee, Attendance, Leave, Payroll, PerformanceHistory
 
-
-class EmployeeModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser',
-            password='testpassword'
-        )
-
-        self.employee = Employee.objects.create(
-            user=self.user,
-            name='Test Employee',
-            emp_id='EMP001',
-            department='IT',
-            position='Developer',
-            date_of_hire=date(2020, 1, 1),
-            gender='M',
-            marital_status='Single',
-            age=30,
-            race='White',
-            hispanic_latino='No',
-            recruitment_source='LinkedIn',
-            salary=Decimal('60000.00'),
-            engagement_survey=4.0,
-            emp_satisfaction=4,
-            special_projects_count=2,
-            days_late_last_30=1,
-            absences=3,
-            employment_status='Active'
-        )
-
+# Hash once per process instead of once per test class
+_TEST_PWD = make_password('testpassword')
+_ADMIN_PWD = make_password('adminpassword')
+
+# Field values for the module's default employee (EMP001)
+DEFAULTS = {
+    'name': 'Test Employee',
+    'emp_id': 'EMP001',
+    'department': 'IT',
+    'position': 'Developer',
+    'date_of_hire': date(2020, 1, 1),
+    'gender': 'M',
+    'marital_status': 'Single',
+    'age': 30,
+    'race': 'White',
+    'hispanic_latino': 'No',
+    'recruitment_source': 'LinkedIn',
+    'salary': Decimal('60000.00'),
+    'engagement_survey': 4.0,
+    'emp_satisfaction': 4,
+    'special_projects_count': 2,
+    'days_late_last_30': 1,
+    'absences': 3,
+    'employment_status': 'Active',
+}
+
+
+def _build_default_employee(**overrides):
+    """Return an unsaved Employee built from DEFAULTS, with any overrides applied."""
+    return Employee(**{**DEFAULTS, **overrides})
+
+
+# Prediction payloads passed to save_prediction_details (read-only)
+_VALID_PREDICTION = {
+    'prediction': 3,
+    'prediction_label': 'Fully Meets',
+    'probabilities': {1: 0.1, 2: 0.2, 3: 0.6, 4: 0.1}
+}
+_INVALID_PREDICTION = {'prediction': 999}
+
+
+class ModelTestBase(TestCase):
+    """Creates the users and default employee shared by every model test class."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.today = date.today()
+        User.objects.bulk_create([
+            User(username='testuser', password=_TEST_PWD),
+            User(username='admin', password=_ADMIN_PWD, is_staff=True),
+        ])
+        # Re-fetch so primary keys are set on backends that don't return them
+        users = User.objects.in_bulk(['testuser', 'admin'], field_name='username')
+        cls.user = users['testuser']
+        cls.admin_user = users['admin']
+
+        Employee.objects.bulk_create([_build_default_employee(user=cls.user)])
+        cls.employee = Employee.objects.select_related('user').get(emp_id='EMP001')
+
+
+class EmployeeModelTest(ModelTestBase):
     def test_employee_creation(self):
         """Test basic employee creation."""
-        self.assertEqual(self.employee.name, 'Test Employee')
-        self.assertEqual(self.employee.emp_id, 'EMP001')
-        self.assertEqual(self.employee.user, self.user)
+        # The fixture is already in memory, including its user
+        with self.assertNumQueries(0):
+            self.assertEqual(self.employee.name, 'Test Employee')
+            self.assertEqual(self.employee.emp_id, 'EMP001')
+            self.assertEqual(self.employee.user, self.user)
 
     def test_salary_as_float(self):
         """Test salary_as_float method."""
@@ -57,108 +90,48 @@ class EmployeeModelTest(TestCase):
         self.assertGreater(tenure, 0)
 
         # Edge case: future hire date
-        self.employee.date_of_hire = date.today() + timedelta(days=30)
+        self.employee.date_of_hire = self.today + timedelta(days=30)
         self.employee.save()
         tenure = self.employee.get_tenure_years()
         self.assertLess(tenure, 0)
 
     def test_save_prediction_details(self):
         """Test save_prediction_details method with valid data."""
-        # Use atomic transaction to ensure changes are committed
-        with transaction.atomic():
-            prediction_result = {
-                'prediction': 3,
-                'prediction_label': 'Fully Meets',
-                'probabilities': {1: 0.1, 2: 0.2, 3: 0.6, 4: 0.1}
-            }
-
-            # Call the method
-            self.employee.save_prediction_details(prediction_result)
-
-            # Force a save to ensure persistence
-            self.employee.save()
-
-            # Explicitly refresh from database
-            self.employee.refresh_from_db()
-
-            # Check that values were saved correctly
-            self.assertEqual(self.employee.predicted_score, 3)
-            # Check the database value (short form)
-            self.assertEqual(self.employee.performance_score, 'Fully Meets')
-            self.assertEqual(self.employee.prediction_confidence, 0.6)
-
-
-    def test_debug_save_prediction_details(self):
-        """Debug test to understand why prediction details aren't being saved."""
-        from django.db import connection
-
-        # Examine the actual model implementation
-        import inspect
-        from employee_predictor.models import Employee
-
-        # Print the actual method implementation
-        print("\nDEBUG: save_prediction_details method:")
-        print(inspect.getsource(Employee.save_prediction_details))
-
-        # Create a test prediction with both prediction and prediction_score keys
-        prediction_result = {
-            'prediction': 3,
-            'prediction_score': 3,  # Try both keys
-            'prediction_label': 'Fully Meets',
-            'probabilities': {1: 0.1, 2: 0.2, 3: 0.6, 4: 0.1}
-        }
-
-        # Reset the employee to known state
-        self.employee.predicted_score = None
-        self.employee.performance_score = None
-        self.employee.prediction_confidence = None
-        self.employee.save()
-
-        # Call the method
-        self.employee.save_prediction_details(prediction_result)
-
-        # Print the SQL queries executed
-        print("\nDEBUG: SQL queries executed:")
-        for i, query in enumerate(connection.queries[-5:]):
-            print(f"Query {i + 1}: {query['sql']}")
-
-        # Get a fresh instance from the database to verify persistence
-        fresh_employee = Employee.objects.get(id=self.employee.id)
-
-        print(f"\nDEBUG: Values after save_prediction_details:")
-        print(f"Original employee.predicted_score = {self.employee.predicted_score}")
-        print(f"Original employee.performance_score = {self.employee.performance_score}")
-        print(f"Fresh employee.predicted_score = {fresh_employee.predicted_score}")
-        print(f"Fresh employee.performance_score = {fresh_employee.performance_score}")
-
-        # Now try explicitly saving
-        if self.employee.predicted_score is not None and fresh_employee.predicted_score is None:
-            print("\nDEBUG: Values not persisted, trying explicit save...")
-            self.employee.save()
-
-            # Check again after explicit save
-            fresh_employee = Employee.objects.get(id=self.employee.id)
-            print(f"After explicit save - fresh employee.predicted_score = {fresh_employee.predicted_score}")
+        # Call the method (it saves the employee itself): full_clean() checks
+        # the user FK and the two unique fields, then a single UPDATE
+        with self.assertNumQueries(4):
+            self.employee.save_prediction_details(_VALID_PREDICTION)
+
+        # Read back only the prediction columns to verify persistence
+        saved = Employee.objects.only(
+            'predicted_score', 'performance_score', 'prediction_confidence'
+        ).get(pk=self.employee.pk)
+
+        # Check that values were saved correctly
+        self.assertEqual(saved.predicted_score, 3)
+        # Check the database value (short form)
+        self.assertEqual(saved.performance_score, 'Fully Meets')
+        self.assertEqual(saved.prediction_confidence, 0.6)
+
+    def test_prediction_details_round_trip(self):
+        """Test prediction_details is stored as JSON and read back as a dict."""
+        self.employee.save_prediction_details(
+            dict(_VALID_PREDICTION, key_factors=[Decimal('1.5')], model_version=date(2024, 1, 1))
+        )
 
-        # Assert to make the test pass for now, we just want debug output
-        self.assertIsNotNone(self.employee)
+        details = Employee.objects.get(pk=self.employee.pk).get_prediction_details()
+        self.assertEqual(details['prediction_score'], 3)
+        # Non-JSON types are stored in string form rather than failing the save
+        self.assertEqual(details['key_factors'], ['1.5'])
+        self.assertEqual(details['model_version'], '2024-01-01')
 
     def test_save_prediction_details_edge_cases(self):
         """Test save_prediction_details with edge cases."""
-        # Use atomic transaction to ensure changes are committed
-        with transaction.atomic():
-            # Test with invalid score (not in mapping)
-            self.employee.save_prediction_details({'prediction': 999})
+        # Test with invalid score (not in mapping)
+        self.employee.save_prediction_details(_INVALID_PREDICTION)
 
-            # Force a save to ensure persistence
-            self.employee.save()
-
-            # Explicitly refresh from database
-            self.employee.refresh_from_db()
-
-            # Check that values were saved correctly
-            self.assertEqual(self.employee.predicted_score, 999)
-            self.assertIsNone(self.employee.performance_score)
+        self.assertEqual(self.employee.predicted_score, 999)
+        self.assertIsNone(self.employee.performance_score)
 
     def test_get_prediction_details(self):
         """Test get_prediction_details method."""
@@ -206,8 +179,9 @@ class EmployeeModelTest(TestCase):
         }
 
         for score, expected_label in performance_scores.items():
-            self.employee.predicted_score = score
-            self.assertEqual(self.employee.get_performance_label(), expected_label)
+            with self.subTest(score=score):
+                self.employee.predicted_score = score
+                self.assertEqual(self.employee.get_performance_label(), expected_label)
 
     def test_get_performance_color(self):
         """Test get_performance_color with all possible scores."""
@@ -219,36 +193,17 @@ class EmployeeModelTest(TestCase):
             (None, "secondary"),
             (999, "secondary")  # Invalid score
         ]:
-            self.employee.predicted_score = score
-            self.assertEqual(self.employee.get_performance_color(), expected_color)
-
-
-class AttendanceModelTest(TestCase):
-    def setUp(self):
-        # Create employee
-        self.employee = Employee.objects.create(
-            name='Test Employee',
-            emp_id='EMP001',
-            department='IT',
-            position='Developer',
-            date_of_hire=date(2020, 1, 1),
-            gender='M',
-            marital_status='Single',
-            salary=Decimal('60000.00'),
-            engagement_survey=4.0,
-            emp_satisfaction=4,
-            special_projects_count=2,
-            days_late_last_30=1,
-            absences=3,
-            hispanic_latino='No',
-            employment_status='Active'
-        )
+            with self.subTest(score=score):
+                self.employee.predicted_score = score
+                self.assertEqual(self.employee.get_performance_color(), expected_color)
+
 
+class AttendanceModelTest(ModelTestBase):
     def test_attendance_creation(self):
         """Test basic attendance creation."""
         attendance = Attendance.objects.create(
             employee=self.employee,
-            date=date.today(),
+            date=self.today,
             check_in=time(9, 0),
             check_out=time(17, 0),
             status='PRESENT',
@@ -263,7 +218,7 @@ class AttendanceModelTest(TestCase):
         """Test calculate_hours_worked method."""
         attendance = Attendance.objects.create(
             employee=self.employee,
-            date=date.today(),
+            date=self.today,
             check_in=time(9, 0),
             check_out=time(17, 0),
             status='PRESENT'
@@ -276,19 +231,24 @@ class AttendanceModelTest(TestCase):
         """Test Attendance.save method with all possible statuses."""
         statuses = ['PRESENT', 'ABSENT', 'LATE', 'HALF_DAY', 'ON_LEAVE']
 
-        for i, status in enumerate(statuses):
-            attendance = Attendance.objects.create(
+        # Insert all rows in one statement; bulk_create bypasses save()
+        Attendance.objects.bulk_create([
+            Attendance(
                 employee=self.employee,
-                date=date.today() - timedelta(days=i),  # Ensure unique dates
+                date=self.today - timedelta(days=i),  # Ensure unique dates
                 status=status,
                 check_in=time(9, 0) if status not in ['ABSENT', 'ON_LEAVE'] else None,
                 check_out=time(17, 0) if status not in ['ABSENT', 'ON_LEAVE'] else None,
                 # Explicitly set hours_worked for all statuses to avoid test failure
                 hours_worked=Decimal('8.00') if status == 'PRESENT' else Decimal('0.00')
             )
+            for i, status in enumerate(statuses)
+        ])
 
-            # Refresh from database to get actual saved values
-            attendance.refresh_from_db()
+        # Run the save() override under test on each stored row
+        for attendance in Attendance.objects.filter(employee=self.employee).order_by('-date'):
+            attendance.save()
+            status = attendance.status
 
             if status == 'ON_LEAVE' or status == 'ABSENT':
                 self.assertIsNone(attendance.check_in)
@@ -297,40 +257,18 @@ class AttendanceModelTest(TestCase):
             elif status == 'PRESENT':
                 self.assertEqual(attendance.hours_worked, Decimal('8.00'))
 
-class LeaveModelTest(TestCase):
-    def setUp(self):
-        # Create admin user
-        self.admin_user = User.objects.create_user(
-            username='admin',
-            password='adminpassword',
-            is_staff=True
-        )
-
-        # Create employee
-        self.employee = Employee.objects.create(
-            name='Test Employee',
-            emp_id='EMP001',
-            department='IT',
-            position='Developer',
-            date_of_hire=date(2020, 1, 1),
-            gender='M',
-            marital_status='Single',
-            salary=Decimal('60000.00'),
-            engagement_survey=4.0,
-            emp_satisfaction=4,
-            special_projects_count=2,
-            days_late_last_30=1,
-            absences=3,
-            hispanic_latino='No',
-            employment_status='Active'
-        )
+class LeaveModelTest(ModelTestBase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.today_plus_3 = cls.today + timedelta(days=3)
 
     def test_leave_creation(self):
         """Test basic leave creation."""
         leave = Leave.objects.create(
             employee=self.employee,
-            start_date=date.today(),
-            end_date=date.today() + timedelta(days=3),
+            start_date=self.today,
+            end_date=self.today_plus_3,
             leave_type='ANNUAL',
             status='PENDING',
             reason='Family vacation'
@@ -368,8 +306,8 @@ class LeaveModelTest(TestCase):
         """Test approving a leave."""
         leave = Leave.objects.create(
             employee=self.employee,
-            start_date=date.today(),
-            end_date=date.today() + timedelta(days=3),
+            start_date=self.today,
+            end_date=self.today_plus_3,
             leave_type='ANNUAL',
             status='PENDING',
             reason='Family vacation'
@@ -383,27 +321,30 @@ class LeaveModelTest(TestCase):
         self.assertEqual(leave.approved_by, self.admin_user)
 
 
-class PayrollModelTest(TestCase):
-    def setUp(self):
-        # Create employee
-        self.employee = Employee.objects.create(
-            name='Test Employee',
-            emp_id='EMP001',
-            department='IT',
-            position='Developer',
-            date_of_hire=date(2020, 1, 1),
-            gender='M',
-            marital_status='Single',
-            salary=Decimal('60000.00'),
-            engagement_survey=4.0,
-            emp_satisfaction=4,
-            special_projects_count=2,
-            days_late_last_30=1,
-            absences=3,
-            hispanic_latino='No',
-            employment_status='Active'
-        )
+# (basic_salary, overtime_hours, overtime_rate, bonuses, deductions, tax, expected_net),
+# evaluated once at import.
+_NET_SALARY_CASES = (
+    # No overtime
+    (Decimal('5000.00'), Decimal('0.00'), Decimal('20.00'), Decimal('500.00'),
+     Decimal('200.00'), Decimal('800.00'), Decimal('5000.00') + Decimal('500.00') -
+     Decimal('200.00') - Decimal('800.00')),
+
+    # No bonuses
+    (Decimal('5000.00'), Decimal('10.00'), Decimal('20.00'), Decimal('0.00'),
+     Decimal('200.00'), Decimal('800.00'), Decimal('5000.00') + Decimal('10.00') *
+     Decimal('20.00') - Decimal('200.00') - Decimal('800.00')),
 
+    # No deductions or tax
+    (Decimal('5000.00'), Decimal('10.00'), Decimal('20.00'), Decimal('500.00'),
+     Decimal('0.00'), Decimal('0.00'), Decimal('5000.00') + Decimal('10.00') *
+     Decimal('20.00') + Decimal('500.00')),
+)
+
+# Net salary for the default payroll row: 5000 + 10 * 20 + 500 - 200 - 800
+_EXPECTED_NET = Decimal('5000.00') + Decimal('200.00') + Decimal('500.00') - Decimal('200.00') - Decimal('800.00')
+
+
+class PayrollModelTest(ModelTestBase):
     def test_payroll_creation(self):
         """Test basic payroll creation."""
         # Monthly salary: 5000.00
@@ -425,9 +366,7 @@ class PayrollModelTest(TestCase):
         self.assertEqual(payroll.status, 'DRAFT')
 
         # Net salary should be calculated on save
-        expected_net = Decimal('5000.00') + (Decimal('10.00') * Decimal('20.00')) + Decimal('500.00') - Decimal(
-            '200.00') - Decimal('800.00')
-        self.assertEqual(payroll.net_salary, expected_net)
+        self.assertEqual(payroll.net_salary, _EXPECTED_NET)
 
     def test_calculate_net_salary(self):
         """Test calculate_net_salary method."""
@@ -447,78 +386,35 @@ class PayrollModelTest(TestCase):
         )
 
         # Calculate net salary manually
-        expected_net = Decimal('5000.00') + (Decimal('10.00') * Decimal('20.00')) + Decimal('500.00') - Decimal(
-            '200.00') - Decimal('800.00')
         calculated_net = payroll.calculate_net_salary()
 
-        self.assertEqual(calculated_net, expected_net)
-        self.assertEqual(payroll.net_salary, expected_net)  # Auto-calculated on save
+        self.assertEqual(calculated_net, _EXPECTED_NET)
+        self.assertEqual(payroll.net_salary, _EXPECTED_NET)  # Auto-calculated on save
 
     def test_calculate_net_salary_variations(self):
         """Test calculate_net_salary with different inputs."""
-        test_cases = [
-            # No overtime
-            (Decimal('5000.00'), Decimal('0.00'), Decimal('20.00'), Decimal('500.00'),
-             Decimal('200.00'), Decimal('800.00'), Decimal('5000.00') + Decimal('500.00') -
-             Decimal('200.00') - Decimal('800.00')),
-
-            # No bonuses
-            (Decimal('5000.00'), Decimal('10.00'), Decimal('20.00'), Decimal('0.00'),
-             Decimal('200.00'), Decimal('800.00'), Decimal('5000.00') + Decimal('10.00') *
-             Decimal('20.00') - Decimal('200.00') - Decimal('800.00')),
-
-            # No deductions or tax
-            (Decimal('5000.00'), Decimal('10.00'), Decimal('20.00'), Decimal('500.00'),
-             Decimal('0.00'), Decimal('0.00'), Decimal('5000.00') + Decimal('10.00') *
-             Decimal('20.00') + Decimal('500.00'))
-        ]
-
         for (basic_salary, overtime_hours, overtime_rate, bonuses,
-             deductions, tax, expected_net) in test_cases:
-            payroll = Payroll(
-                employee=self.employee,
-                period_start=date(2023, 1, 1),
-                period_end=date(2023, 1, 31),
-                basic_salary=basic_salary,
-                overtime_hours=overtime_hours,
-                overtime_rate=overtime_rate,
-                bonuses=bonuses,
-                deductions=deductions,
-                tax=tax,
-                net_salary=Decimal('0.00')  # Will be calculated
-            )
-
-            calculated_net = payroll.calculate_net_salary()
-            self.assertEqual(calculated_net, expected_net)
-
-
-class PerformanceHistoryModelTest(TestCase):
-    def setUp(self):
-        # Create user
-        self.user = User.objects.create_user(
-            username='testuser',
-            password='testpassword'
-        )
-
-        # Create employee
-        self.employee = Employee.objects.create(
-            name='Test Employee',
-            emp_id='EMP001',
-            department='IT',
-            position='Developer',
-            date_of_hire=date(2020, 1, 1),
-            gender='M',
-            marital_status='Single',
-            salary=Decimal('60000.00'),
-            engagement_survey=4.0,
-            emp_satisfaction=4,
-            special_projects_count=2,
-            days_late_last_30=1,
-            absences=3,
-            hispanic_latino='No',
-            employment_status='Active'
-        )
-
+             deductions, tax, expected_net) in _NET_SALARY_CASES:
+            with self.subTest(basic_salary=basic_salary, overtime_hours=overtime_hours,
+                              bonuses=bonuses, deductions=deductions, tax=tax):
+                payroll = Payroll(
+                    employee=self.employee,
+                    period_start=date(2023, 1, 1),
+                    period_end=date(2023, 1, 31),
+                    basic_salary=basic_salary,
+                    overtime_hours=overtime_hours,
+                    overtime_rate=overtime_rate,
+                    bonuses=bonuses,
+                    deductions=deductions,
+                    tax=tax,
+                    net_salary=Decimal('0.00')  # Will be calculated
+                )
+
+                calculated_net = payroll.calculate_net_salary()
+                self.assertEqual(calculated_net, expected_net)
+
+
+class PerformanceHistoryModelTest(ModelTestBase):
     def test_performance_history_creation(self):
         """Test performance history creation."""
         history = PerformanceHistory.objects.create(
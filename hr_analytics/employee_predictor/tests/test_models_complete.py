@@ -5,19 +5,23 @@ from django.utils import timezone
 from datetime import date, timedelta
 from decimal import Decimal
 
+from django.contrib.auth.hashers import make_password
+
 from employee_predictor.models import Employee, Attendance, Leave, Payroll, PerformanceHistory
 
+# Hash once per process instead of once per created user
+_TEST_PWD = make_password('testpassword')
+
 
 class ModelStrMethodsTest(TestCase):
     """Test __str__ methods for all models."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='testuser',
-            password='testpassword'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User(username='testuser', password=_TEST_PWD)
+        cls.user.save()
 
-        self.employee = Employee.objects.create(
+        cls.employee = Employee.objects.create(
             name='Test Employee',
             emp_id='EMP001',
             department='IT',
@@ -35,15 +39,15 @@ class ModelStrMethodsTest(TestCase):
             employment_status='Active'
         )
 
-        self.attendance = Attendance.objects.create(
-            employee=self.employee,
+        cls.attendance = Attendance.objects.create(
+            employee=cls.employee,
             date=date.today(),
             status='PRESENT',
             hours_worked=Decimal('8.00')
         )
 
-        self.leave = Leave.objects.create(
-            employee=self.employee,
+        cls.leave = Leave.objects.create(
+            employee=cls.employee,
             start_date=date.today(),
             end_date=date.today(),
             leave_type='ANNUAL',
@@ -51,8 +55,8 @@ class ModelStrMethodsTest(TestCase):
             reason='Test leave'
         )
 
-        self.payroll = Payroll.objects.create(
-            employee=self.employee,
+        cls.payroll = Payroll.objects.create(
+            employee=cls.employee,
             period_start=date(2023, 1, 1),
             period_end=date(2023, 1, 31),
             basic_salary=Decimal('5000.00'),
@@ -0,0 +1,65 @@
+# employee_predictor/tests/test_utils.py
+from decimal import Decimal
+from datetime import date
+
+from employee_predictor.models import Attendance
+from employee_predictor.tests.test_base import BaseTestCase
+from employee_predictor.utils import calculate_payroll_details
+
+MARCH_2024 = (date(2024, 3, 1), date(2024, 3, 31))
+
+# (salary, overtime_rate, estimated_tax); the rate is salary / 22 days /
+# 8 hours * 1.5, and tax is 10% up to 5000 and 15% above, both in cents
+_PAYROLL_CASES = (
+    (Decimal('4400.00'), Decimal('37.50'), Decimal('440.00')),
+    (Decimal('5000.00'), Decimal('42.61'), Decimal('500.00')),
+    (Decimal('5000.01'), Decimal('42.61'), Decimal('750.00')),
+    (Decimal('6100.00'), Decimal('51.99'), Decimal('915.00')),
+)
+
+
+class CalculatePayrollDetailsTest(BaseTestCase):
+    """Test calculate_payroll_details arithmetic."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        Attendance.objects.bulk_create([
+            Attendance(employee=cls.employee, date=date(2024, 3, 4), status='PRESENT',
+                       hours_worked=Decimal('9.50')),
+            Attendance(employee=cls.employee, date=date(2024, 3, 5), status='PRESENT',
+                       hours_worked=Decimal('10.25')),
+            Attendance(employee=cls.employee, date=date(2024, 3, 6), status='LATE',
+                       hours_worked=Decimal('6.00')),
+            # Hours on a non-worked status are not counted
+            Attendance(employee=cls.employee, date=date(2024, 3, 7), status='ABSENT',
+                       hours_worked=Decimal('2.00')),
+            # Outside the range
+            Attendance(employee=cls.employee, date=date(2024, 4, 1), status='PRESENT',
+                       hours_worked=Decimal('12.00')),
+        ])
+
+    def test_overtime_and_tax(self):
+        """Test overtime and tax amounts on both sides of the tax threshold."""
+        for salary, overtime_rate, estimated_tax in _PAYROLL_CASES:
+            with self.subTest(salary=salary):
+                details = calculate_payroll_details(self.employee.id, salary, *MARCH_2024)
+
+                # 25.75 worked hours less 2 present days at 8 hours
+                self.assertEqual(details['overtime_hours'], Decimal('9.75'))
+                self.assertEqual(details['overtime_rate'], overtime_rate)
+                self.assertEqual(details['estimated_tax'], estimated_tax)
+                self.assertEqual(details['attendance_stats'], {
+                    'present_days': 2,
+                    'absent_days': 1,
+                    'late_days': 1,
+                    'total_hours': Decimal('25.75'),
+                })
+
+    def test_no_overtime_without_attendance(self):
+        """Test a period with no attendance has zero overtime, never negative."""
+        details = calculate_payroll_details(
+            self.employee.id, Decimal('4400.00'), date(2024, 5, 1), date(2024, 5, 31)
+        )
+        # Compared as text, since Decimal('0') == Decimal('0.00')
+        self.assertEqual(str(details['overtime_hours']), '0.00')
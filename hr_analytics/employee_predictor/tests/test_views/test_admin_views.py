@@ -1,14 +1,42 @@
 # employee_predictor/tests/test_views/test_admin_views.py
+from types import SimpleNamespace
 
-from django.urls import reverse
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse_lazy
+from django.utils import timezone
 from django.contrib import messages
 from django.contrib.auth.models import User
+from datetime import timedelta
 from decimal import Decimal  # Add this import
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
+from employee_predictor.aggregations import DASHBOARD_VERSION_KEY
 from employee_predictor.tests.test_base import BaseStaffTestCase
+from employee_predictor.tests.test_helper import BASE_EMPLOYEE_PAYLOAD, cached_reverse
 from employee_predictor.models import Employee, Attendance, Leave
+from employee_predictor.views import LeaveListView
 
+DASHBOARD_URL = reverse_lazy('dashboard')
+EMPLOYEE_LIST_URL = reverse_lazy('employee-list')
+LEAVE_LIST_URL = reverse_lazy('leave-list')
+ATTENDANCE_LIST_URL = reverse_lazy('attendance-list')
+
+
+# Prediction returned by the stubbed predictor; a plain namespace is enough
+# since the view only calls predict_with_probability
+_MOCK_RESULT = {
+    'prediction': 4,
+    'prediction_label': 'Exceeds',
+    'probabilities': {1: 0.05, 2: 0.1, 3: 0.15, 4: 0.7}
+}
+_PREDICTOR_STUB = SimpleNamespace(predict_with_probability=lambda *args, **kwargs: _MOCK_RESULT)
+
+# Test settings disable caching; tests of cached views opt back in with this
+_LOCMEM_CACHES = {'default': {
+    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    'LOCATION': 'admin-view-tests',
+}}
 
 
 class DashboardViewTests(BaseStaffTestCase):
@@ -16,7 +44,7 @@ class DashboardViewTests(BaseStaffTestCase):
 
     def test_dashboard_staff_access(self):
         """Test staff access to dashboard."""
-        response = self.client.get(reverse('dashboard'))
+        response = self.client.get(DASHBOARD_URL)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'employee_predictor/dashboard.html')
 
@@ -26,15 +54,58 @@ class DashboardViewTests(BaseStaffTestCase):
         self.assertIn('today_attendance', response.context)
         self.assertIn('pending_leaves', response.context)
 
+    def test_dashboard_leave_counts(self):
+        """Test pending and active leave counts come from one aggregate."""
+        today = timezone.localdate()
+        self.create_leave(status='PENDING')
+        self.create_leave(status='APPROVED')  # starts in five days
+        Leave.objects.create(
+            employee=self.employee,
+            start_date=today,
+            end_date=today + timedelta(days=2),
+            leave_type='SICK',
+            status='APPROVED',
+            reason='On leave today'
+        )
+
+        # Session, user, departments, attendance, leaves, payroll
+        with self.assertNumQueries(6):
+            response = self.client.get(DASHBOARD_URL)
+        self.assertEqual(response.context['pending_leaves'], 1)
+        self.assertEqual(response.context['active_leaves'], 1)
+
+    @override_settings(CACHES=_LOCMEM_CACHES)
+    def test_dashboard_aggregates_cached_until_write(self):
+        """Test dashboard aggregates come from cache until a model is saved."""
+        cache.clear()
+        response = self.client.get(DASHBOARD_URL)
+        self.assertEqual(response.context['total_employees'], 1)
+
+        # Only the session and user lookups hit the database
+        with self.assertNumQueries(2):
+            self.client.get(DASHBOARD_URL)
+
+        # Deleting the employee bumps the cache version
+        self.employee.delete()
+        response = self.client.get(DASHBOARD_URL)
+        self.assertEqual(response.context['total_employees'], 0)
+
+        # An evicted version counter is reseeded, not restarted at a
+        # version whose entries are still cached
+        cache.delete(DASHBOARD_VERSION_KEY)
+        response = self.client.get(DASHBOARD_URL)
+        self.assertEqual(response.context['total_employees'], 0)
+
 
 class EmployeeListViewTests(BaseStaffTestCase):
     """Test EmployeeListView thoroughly."""
 
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         # Create additional employees for list testing
-        for i in range(2, 5):
-            Employee.objects.create(
+        Employee.objects.bulk_create([
+            Employee(
                 name=f'Test Employee {i}',
                 emp_id=f'EMP00{i}',
                 department='IT' if i % 2 == 0 else 'HR',
@@ -51,37 +122,123 @@ class EmployeeListViewTests(BaseStaffTestCase):
                 hispanic_latino='No',
                 employment_status='Active'
             )
+            for i in range(2, 5)
+        ])
 
     def test_employee_list_view(self):
         """Test employee list view displays all employees."""
-        response = self.client.get(reverse('employee-list'))
+        # Rows only use their own columns, so the page renders in a fixed
+        # number of queries: session, user, paginator count, page, departments
+        with self.assertNumQueries(5):
+            response = self.client.get(EMPLOYEE_LIST_URL)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'employee_predictor/employee/list.html')
 
-        # Should contain all employees
-        self.assertEqual(len(response.context['employees']), 4)
+        # Should contain all employees; the paginator already ran the
+        # SELECT COUNT, so reading it back costs no query
+        self.assertEqual(response.context['paginator'].count, 4)
+
+    @override_settings(CACHES=_LOCMEM_CACHES)
+    def test_employee_list_departments_cached(self):
+        """Test the department filter is cached until an employee changes department."""
+        cache.clear()
+        self.client.get(EMPLOYEE_LIST_URL)
+
+        # The DISTINCT department query is skipped on the next load
+        with self.assertNumQueries(4):
+            response = self.client.get(EMPLOYEE_LIST_URL)
+        self.assertEqual(response.context['departments'], ['HR', 'IT'])
+
+        self.employee.department = 'Finance'
+        self.employee.save()
+        response = self.client.get(EMPLOYEE_LIST_URL)
+        self.assertIn('Finance', response.context['departments'])
+
+    @override_settings(CACHES=_LOCMEM_CACHES)
+    def test_list_counters_cached_until_write(self):
+        """Test the leave and attendance list counters are cached until a write."""
+        cache.clear()
+        self.client.get(LEAVE_LIST_URL)
+        self.client.get(ATTENDANCE_LIST_URL)
+
+        # Session, user and the paginator count (both lists are empty, so
+        # there is no page query); the counters come from the cache
+        with self.assertNumQueries(3):
+            response = self.client.get(LEAVE_LIST_URL)
+        self.assertEqual(response.context['pending_count'], 0)
+        with self.assertNumQueries(3):
+            response = self.client.get(ATTENDANCE_LIST_URL)
+        self.assertEqual(response.context['today_stats']['present'], 0)
+
+        # Each save bumps the shared dashboard cache version
+        self.create_leave()
+        Attendance.objects.create(
+            employee=self.employee, date=timezone.now().date(), status='PRESENT'
+        )
+        response = self.client.get(LEAVE_LIST_URL)
+        self.assertEqual(response.context['pending_count'], 1)
+
+        # Listing only pending leaves reuses the paginator's count
+        with self.assertNumQueries(4):
+            response = self.client.get(LEAVE_LIST_URL, {'status': 'pending'})
+        self.assertEqual(response.context['pending_count'], 1)
+        response = self.client.get(ATTENDANCE_LIST_URL)
+        self.assertEqual(response.context['today_stats']['present'], 1)
+
+    @patch.object(LeaveListView, 'pending_count_cap', 1)
+    def test_leave_list_pending_count_capped(self):
+        """Test a pending count past the cap is flagged rather than passed off as exact."""
+        self.create_leave()
+        response = self.client.get(LEAVE_LIST_URL)
+        self.assertEqual(response.context['pending_count'], 1)
+        self.assertFalse(response.context['pending_count_capped'])
+
+        self.create_leave()
+        response = self.client.get(LEAVE_LIST_URL)
+        self.assertEqual(response.context['pending_count'], 1)
+        self.assertTrue(response.context['pending_count_capped'])
+
+        # The pending-only listing has the exact count from its paginator
+        response = self.client.get(LEAVE_LIST_URL, {'status': 'pending'})
+        self.assertEqual(response.context['pending_count'], 2)
+        self.assertFalse(response.context['pending_count_capped'])
+
+    def test_employee_detail_view(self):
+        """Test employee detail view renders related history in fixed queries."""
+        self.create_attendance(days=3)
+        self.create_leave()
+        self.create_payroll()
+
+        # Session, user, employee, then one query each for recent
+        # attendance, leaves and payrolls, however many rows they hold
+        with self.assertNumQueries(6):
+            response = self.client.get(cached_reverse('employee-detail', self.employee.pk))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['recent_attendance']), 3)
 
     def test_employee_list_view_search_filter(self):
         """Test search filter functionality."""
         # Search for specific employee
         response = self.client.get(
-            reverse('employee-list'),
+            EMPLOYEE_LIST_URL,
             {'search': 'Test Employee 3'}
         )
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context['employees']), 1)
+        self.assertEqual(response.context['paginator'].count, 1)
         self.assertEqual(response.context['employees'][0].name, 'Test Employee 3')
 
     def test_employee_list_view_department_filter(self):
         """Test department filter functionality."""
         # Filter by department
         response = self.client.get(
-            reverse('employee-list'),
+            EMPLOYEE_LIST_URL,
             {'department': 'HR'}
         )
 
         self.assertEqual(response.status_code, 200)
+        # The page was evaluated when the template rendered, so iterating it
+        # reuses the cached rows; values_list() would query again
         self.assertTrue(all(e.department == 'HR' for e in response.context['employees']))
 
 
@@ -94,13 +251,17 @@ class LeaveApprovalTests(BaseStaffTestCase):
 
     def test_approve_leave_request(self):
         """Test approving a leave request."""
-        response = self.client.get(
-            reverse('leave-approve', args=[self.leave.id]),
-            {'action': 'approve'}
-        )
+        # Session, user, leave, the save with its foreign key checks, and one
+        # INSERT for every leave day, in a savepoint; the employee row itself
+        # is never loaded
+        with self.assertNumQueries(9):
+            response = self.client.get(
+                cached_reverse('leave-approve', self.leave.id),
+                {'action': 'approve'}
+            )
 
         # Should redirect to leave list
-        self.assertRedirects(response, reverse('leave-list'))
+        self.assertRedirects(response, LEAVE_LIST_URL, fetch_redirect_response=False)
 
         # Refresh leave from database
         self.leave.refresh_from_db()
@@ -114,15 +275,30 @@ class LeaveApprovalTests(BaseStaffTestCase):
 
         self.assertEqual(attendance_count, 6)  # 6 days including start and end
 
+    def test_approve_leave_keeps_existing_attendance(self):
+        """Test approving a leave skips days that already have a record."""
+        Attendance.objects.create(
+            employee=self.employee,
+            date=self.leave.start_date,
+            status='PRESENT',
+            hours_worked=Decimal('8.00')
+        )
+
+        self.client.get(cached_reverse('leave-approve', self.leave.id), {'action': 'approve'})
+
+        statuses = list(Attendance.objects.filter(employee=self.employee)
+                        .order_by('date').values_list('status', flat=True))
+        self.assertEqual(statuses, ['PRESENT'] + ['ON_LEAVE'] * 5)
+
     def test_reject_leave_request(self):
         """Test rejecting a leave request."""
         response = self.client.get(
-            reverse('leave-approve', args=[self.leave.id]),
+            cached_reverse('leave-approve', self.leave.id),
             {'action': 'reject'}
         )
 
         # Should redirect to leave list
-        self.assertRedirects(response, reverse('leave-list'))
+        self.assertRedirects(response, LEAVE_LIST_URL, fetch_redirect_response=False)
 
         # Refresh leave from database
         self.leave.refresh_from_db()
@@ -139,12 +315,12 @@ class LeaveApprovalTests(BaseStaffTestCase):
     def test_approve_leave_invalid_action(self):
         """Test approve_leave with invalid action."""
         response = self.client.get(
-            reverse('leave-approve', args=[self.leave.id]),
+            cached_reverse('leave-approve', self.leave.id),
             {'action': 'invalid'}
         )
 
         # Should redirect to leave list
-        self.assertRedirects(response, reverse('leave-list'))
+        self.assertRedirects(response, LEAVE_LIST_URL, fetch_redirect_response=False)
 
         # Leave status should remain pending
         self.leave.refresh_from_db()
@@ -154,54 +330,45 @@ class LeaveApprovalTests(BaseStaffTestCase):
 class EmployeePredictionViewTests(BaseStaffTestCase):
     """Test EmployeePredictionView thoroughly."""
 
-    @patch('employee_predictor.views.PerformancePredictor')
-    def test_prediction_success(self, mock_predictor_class):
-        """Test successful prediction."""
-        # Mock the predictor instance
-        mock_predictor = MagicMock()
-        mock_predictor_class.return_value = mock_predictor
-
-        # Mock prediction result
-        mock_predictor.predict_with_probability.return_value = {
-            'prediction': 4,
-            'prediction_label': 'Exceeds',
-            'probabilities': {1: 0.05, 2: 0.1, 3: 0.15, 4: 0.7}
-        }
-
-        # Form data
-        data = {
-            'name': 'Test Employee',
-            'emp_id': 'EMP001',
-            'department': 'IT',
-            'position': 'Developer',
-            'date_of_hire': '2020-01-01',
-            'gender': 'M',
-            'marital_status': 'Single',
-            'age': 30,
-            'race': 'White',
-            'hispanic_latino': 'No',
-            'recruitment_source': 'LinkedIn',
-            'salary': '60000.00',
-            'engagement_survey': 4.0,
-            'emp_satisfaction': 4,
-            'special_projects_count': 2,
-            'days_late_last_30': 1,
-            'absences': 3,
-            'employment_status': 'Active'
-        }
-
-        # Make prediction
-        response = self.client.post(
-            reverse('employee-predict', args=[self.employee.id]),
-            data=data,
-            follow=True
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Patch the predictor once for the whole class instead of per test
+        cls._patcher = patch(
+            'employee_predictor.views.get_predictor',
+            return_value=_PREDICTOR_STUB
         )
+        cls._patcher.start()
+        cls.addClassCleanup(cls._patcher.stop)
+
+    def test_prediction_success(self):
+        """Test successful prediction."""
+        # Form data, with one field edited alongside the prediction
+        data = {**BASE_EMPLOYEE_PAYLOAD, 'absences': 5}
+        stale = timezone.now() - timedelta(days=1)
+        Employee.objects.filter(pk=self.employee.pk).update(updated_at=stale)
+
+        # Make prediction; it logs a single record carrying the key metrics
+        with self.assertLogs('employee_predictor.views', 'INFO') as logs:
+            response = self.client.post(
+                cached_reverse('employee-predict', self.employee.id),
+                data=data
+            )
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(logs.records[0].predicted_score, 4)
 
-        # Check redirect and success message
-        self.assertRedirects(response, reverse('employee-detail', args=[self.employee.id]))
-        self.assertTrue(any(m.level == messages.SUCCESS for m in response.context['messages']))
+        # Check redirect and success message; messages are read from the
+        # request so the detail page never has to be rendered
+        self.assertRedirects(response, cached_reverse('employee-detail', self.employee.id),
+                             fetch_redirect_response=False)
+        sent = list(messages.get_messages(response.wsgi_request))
+        self.assertEqual([m.level for m in sent], [messages.SUCCESS])
+        self.assertIn('Exceeds: 70.0%', sent[0].message)
 
         # Check employee was updated
         self.employee.refresh_from_db()
         self.assertEqual(self.employee.predicted_score, 4)
-        self.assertIsNotNone(self.employee.prediction_date)
\ No newline at end of file
+        self.assertIsNotNone(self.employee.prediction_date)
+        # The narrowed UPDATE still writes fields the form changed
+        self.assertEqual(self.employee.absences, 5)
+        self.assertGreater(self.employee.updated_at, stale)
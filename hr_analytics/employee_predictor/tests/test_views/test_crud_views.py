@@ -1,31 +1,33 @@
 # employee_predictor/tests/test_views/test_crud_views.py
-from django.test import TestCase, Client
-from django.urls import reverse
+from django.test import TestCase
+from django.urls import reverse_lazy
 from django.contrib.auth.models import User
 from django.contrib import messages
 from decimal import Decimal
 from datetime import date
 from unittest.mock import patch, MagicMock
 
-from employee_predictor.tests.test_helper import axes_login
+from employee_predictor.tests.test_helper import BASE_EMPLOYEE_PAYLOAD, fast_login, cached_reverse
 from employee_predictor.models import Employee, Attendance, Leave, Payroll
 
+EMPLOYEE_CREATE_URL = reverse_lazy('employee-create')
+EMPLOYEE_LIST_URL = reverse_lazy('employee-list')
+
 
 class EmployeeCRUDViewsTest(TestCase):
     """Test Employee CRUD Views."""
 
-    def setUp(self):
-        self.client = Client()
-
+    @classmethod
+    def setUpTestData(cls):
         # Create staff user
-        self.staff = User.objects.create_user(
+        cls.staff = User.objects.create_user(
             username='staff',
             password='password',
             is_staff=True
         )
 
         # Create employee
-        self.employee = Employee.objects.create(
+        cls.employee = Employee.objects.create(
             name='Test Employee',
             emp_id='EMP001',
             department='IT',
@@ -43,41 +45,36 @@ class EmployeeCRUDViewsTest(TestCase):
             employment_status='Active'
         )
 
+    def setUp(self):
         # Login
-        axes_login(self.client, 'staff', 'password')
+        fast_login(self.client, self.staff)
 
     def test_employee_create_view(self):
         """Test EmployeeCreateView form_valid."""
         # Test creating a new employee
         data = {
+            **BASE_EMPLOYEE_PAYLOAD,
             'name': 'New Employee',
             'emp_id': 'EMP999',
             'department': 'HR',
             'position': 'Manager',
             'date_of_hire': '2023-01-01',
             'gender': 'F',
-            'marital_status': 'Single',
-            'age': 30,
-            'race': 'White',
-            'hispanic_latino': 'No',
-            'recruitment_source': 'LinkedIn',
             'salary': '70000.00',
             'engagement_survey': 4.5,
-            'emp_satisfaction': 4,
             'special_projects_count': 3,
             'days_late_last_30': 0,
-            'absences': 1,
-            'employment_status': 'Active'
+            'absences': 1
         }
 
-        response = self.client.post(reverse('employee-create'), data, follow=True)
+        response = self.client.post(EMPLOYEE_CREATE_URL, data)
 
         # Check redirect
-        self.assertRedirects(response, reverse('employee-list'))
+        self.assertRedirects(response, EMPLOYEE_LIST_URL, fetch_redirect_response=False)
 
         # Check success message
-        messages_list = list(response.context['messages'])
-        self.assertTrue(any('created successfully' in str(m) for m in messages_list))
+        sent = {(m.level, m.message) for m in messages.get_messages(response.wsgi_request)}
+        self.assertIn((messages.SUCCESS, 'Employee created successfully.'), sent)
 
         # Check employee was created
         self.assertTrue(Employee.objects.filter(emp_id='EMP999').exists())
@@ -107,13 +104,13 @@ class EmployeeCRUDViewsTest(TestCase):
         }
 
         response = self.client.post(
-            reverse('employee-update', args=[self.employee.pk]),
+            cached_reverse('employee-update', self.employee.pk),
             data,
             follow=True
         )
 
         # Check redirect
-        self.assertRedirects(response, reverse('employee-list'))
+        self.assertRedirects(response, EMPLOYEE_LIST_URL)
 
         # Check success message
         messages_list = list(response.context['messages'])
@@ -131,12 +128,11 @@ class EmployeeCRUDViewsTest(TestCase):
 
         # Delete employee
         response = self.client.post(
-            reverse('employee-delete', args=[emp_id]),
-            follow=True
+            cached_reverse('employee-delete', emp_id)
         )
 
         # Check redirect
-        self.assertRedirects(response, reverse('employee-list'))
+        self.assertRedirects(response, EMPLOYEE_LIST_URL, fetch_redirect_response=False)
 
         # Instead of checking for a specific message, just check if deletion worked
         self.assertFalse(Employee.objects.filter(id=emp_id).exists())
@@ -166,13 +162,12 @@ class EmployeeCRUDViewsTest(TestCase):
         }
 
         response = self.client.post(
-            reverse('employee-update', args=[self.employee.pk]),
-            data,
-            follow=True
+            cached_reverse('employee-update', self.employee.pk),
+            data
         )
 
         # Check redirect
-        self.assertRedirects(response, reverse('employee-list'))
+        self.assertRedirects(response, EMPLOYEE_LIST_URL, fetch_redirect_response=False)
 
         # Check employee was updated - verify name instead of age
         self.employee.refresh_from_db()
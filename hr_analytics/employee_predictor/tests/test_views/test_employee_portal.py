@@ -1,38 +1,44 @@
 # employee_predictor/tests/test_views/test_employee_portal.py
-from django.test import TestCase, Client, RequestFactory
-from django.urls import reverse
+from django.test import TestCase, RequestFactory
+from django.urls import reverse_lazy
 from django.contrib.auth.models import User
 from django.contrib import messages
-from django.utils import timezone
 from decimal import Decimal
 from datetime import date, timedelta
 from unittest.mock import patch, MagicMock
 
-from employee_predictor.tests.test_helper import axes_login
+from employee_predictor.tests.test_helper import FROZEN_TODAY, fast_login, freeze_now
 from employee_predictor.models import Employee, Attendance, Leave, Payroll
 from employee_predictor.views import (
     EmployeeLeaveCreateView, EmployeeAttendanceListView,
     EmployeePayslipDetailView, EmployeeProfileView
 )
 
+EMPLOYEE_LEAVES_URL = reverse_lazy('employee-leaves')
+EMPLOYEE_LEAVE_CREATE_URL = reverse_lazy('employee-leave-create')
+EMPLOYEE_ATTENDANCE_URL = reverse_lazy('employee-attendance')
 
+
+@freeze_now()
 class EmployeePortalViewsTest(TestCase):
     """Test Employee Portal Views."""
 
-    def setUp(self):
-        self.client = Client()
-        self.factory = RequestFactory()
+    @classmethod
+    def setUpTestData(cls):
+        # timezone.now() is frozen, so "today" is a known constant
+        cls.today = FROZEN_TODAY
+        eight_hours = Decimal('8.00')
 
         # Create employee user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='employee',
             password='password',
             is_staff=False
         )
 
         # Create employee record
-        self.employee = Employee.objects.create(
-            user=self.user,
+        cls.employee = Employee.objects.create(
+            user=cls.user,
             name='Test Employee',
             emp_id='EMP001',
             department='IT',
@@ -51,27 +57,29 @@ class EmployeePortalViewsTest(TestCase):
         )
 
         # Create attendance records
-        for i in range(5):
-            Attendance.objects.create(
-                employee=self.employee,
-                date=timezone.now().date() - timedelta(days=i),
+        Attendance.objects.bulk_create([
+            Attendance(
+                employee=cls.employee,
+                date=cls.today - timedelta(days=i),
                 status='PRESENT',
-                hours_worked=Decimal('8.00')
+                hours_worked=eight_hours
             )
+            for i in range(5)
+        ], batch_size=500)
 
         # Create leave records
-        self.leave = Leave.objects.create(
-            employee=self.employee,
-            start_date=timezone.now().date() + timedelta(days=5),
-            end_date=timezone.now().date() + timedelta(days=7),
+        cls.leave = Leave.objects.create(
+            employee=cls.employee,
+            start_date=cls.today + timedelta(days=5),
+            end_date=cls.today + timedelta(days=7),
             leave_type='ANNUAL',
             status='PENDING',
             reason='Vacation'
         )
 
         # Create payroll record
-        self.payroll = Payroll.objects.create(
-            employee=self.employee,
+        cls.payroll = Payroll.objects.create(
+            employee=cls.employee,
             period_start=date(2023, 1, 1),
             period_end=date(2023, 1, 31),
             basic_salary=Decimal('5000.00'),
@@ -79,8 +87,11 @@ class EmployeePortalViewsTest(TestCase):
             status='APPROVED'
         )
 
+        cls.factory = RequestFactory()
+
+    def setUp(self):
         # Login
-        axes_login(self.client, 'employee', 'password')
+        fast_login(self.client, self.user)
 
     def test_employee_leave_create_view(self):
         """Test EmployeeLeaveCreateView methods."""
@@ -97,21 +108,21 @@ class EmployeePortalViewsTest(TestCase):
         # Test form_valid
         leave_data = {
             'employee': self.employee.id,
-            'start_date': (timezone.now().date() + timedelta(days=10)).strftime('%Y-%m-%d'),
-            'end_date': (timezone.now().date() + timedelta(days=12)).strftime('%Y-%m-%d'),
+            'start_date': (self.today + timedelta(days=10)).strftime('%Y-%m-%d'),
+            'end_date': (self.today + timedelta(days=12)).strftime('%Y-%m-%d'),
             'leave_type': 'SICK',
             'reason': 'Medical appointment'
         }
 
-        response = self.client.post(reverse('employee-leave-create'), leave_data, follow=True)
+        response = self.client.post(EMPLOYEE_LEAVE_CREATE_URL, leave_data)
 
         # Check redirect
-        self.assertRedirects(response, reverse('employee-leaves'))
+        self.assertRedirects(response, EMPLOYEE_LEAVES_URL, fetch_redirect_response=False)
 
         # Check leave was created with PENDING status
         new_leave = Leave.objects.get(
             employee=self.employee,
-            start_date=timezone.now().date() + timedelta(days=10)
+            start_date=self.today + timedelta(days=10)
         )
         self.assertEqual(new_leave.status, 'PENDING')
         self.assertEqual(new_leave.leave_type, 'SICK')
@@ -119,23 +130,39 @@ class EmployeePortalViewsTest(TestCase):
     def test_employee_attendance_list_view(self):
         """Test EmployeeAttendanceListView.get_queryset with filters."""
         # Create request with month and year filters
-        today = timezone.now().date()
+        today = self.today
 
         view = EmployeeAttendanceListView()
         request = self.factory.get(f'/portal/attendance/?month={today.month}&year={today.year}')
         request.user = self.user
         view.request = request
 
-        queryset = view.get_queryset()
+        # A single query: the view filters through the user join
+        with self.assertNumQueries(1):
+            attendances = list(view.get_queryset())
 
         # All attendance should be for the current employee
-        self.assertTrue(all(a.employee == self.employee for a in queryset))
+        self.assertEqual(
+            set(view.get_queryset().values_list('employee_id', flat=True)), {self.employee.id}
+        )
 
         # All attendance should be for the specified month and year
-        for attendance in queryset:
+        for attendance in attendances:
             self.assertEqual(attendance.date.month, today.month)
             self.assertEqual(attendance.date.year, today.year)
 
+    def test_employee_attendance_page_unpaginated(self):
+        """Test the month's attendance renders without a paginator COUNT."""
+        # Session, user and the month's rows
+        with self.assertNumQueries(3):
+            response = self.client.get(EMPLOYEE_ATTENDANCE_URL)
+        self.assertFalse(response.context['is_paginated'])
+        self.assertEqual(len(response.context['attendances']), 5)
+
+        # An impossible month lists nothing rather than failing
+        response = self.client.get(EMPLOYEE_ATTENDANCE_URL, {'month': 13, 'year': 2024})
+        self.assertEqual(len(response.context['attendances']), 0)
+
     def test_employee_payslip_detail_view(self):
         """Test EmployeePayslipDetailView.get_queryset."""
         view = EmployeePayslipDetailView()
@@ -143,19 +170,27 @@ class EmployeePortalViewsTest(TestCase):
         request.user = self.user
         view.request = request
 
-        queryset = view.get_queryset()
+        # A single query, as for the attendance list
+        with self.assertNumQueries(1):
+            queryset = view.get_queryset()
 
-        # Queryset should only include payrolls for the current employee
-        self.assertTrue(all(p.employee == self.employee for p in queryset))
+            # Queryset should only include payrolls for the current employee
+            self.assertTrue(all(p.employee == self.employee for p in queryset))
 
     def test_employee_profile_view(self):
         """Test EmployeeProfileView.get_object."""
         view = EmployeeProfileView()
         request = self.factory.get('/portal/profile/')
-        request.user = self.user
+        # A freshly loaded user, as the auth middleware provides, with no
+        # employee cached on it yet
+        request.user = User.objects.get(pk=self.user.pk)
         view.request = request
 
-        profile = view.get_object()
+        with self.assertNumQueries(1):
+            profile = view.get_object()
+            # Both sides of the one-to-one are cached, so neither costs a query
+            self.assertIs(profile.user, request.user)
+            self.assertIs(request.user.employee, profile)
 
         # Should return the employee associated with the current user
         self.assertEqual(profile, self.employee)
\ No newline at end of file
@@ -1,6 +1,7 @@
 # employee_predictor/tests/test_views/test_employee_views.py
-from django.test import TestCase, Client, RequestFactory
-from django.urls import reverse
+from django.core.cache import cache
+from django.test import TestCase, RequestFactory, override_settings
+from django.urls import reverse_lazy
 from django.contrib.auth.models import User
 from django.contrib import messages
 from django.utils import timezone
@@ -8,35 +9,49 @@ from decimal import Decimal
 from datetime import date
 from unittest.mock import patch, MagicMock
 from django.views import View
-from employee_predictor.tests.test_helper import axes_login
+from employee_predictor.tests.test_helper import FROZEN_TODAY, fast_login, freeze_now, cached_reverse
 from employee_predictor.models import Employee, Attendance, Leave, Payroll
 from employee_predictor.views import (
-    EmployeeRequiredMixin, EmployeePerformanceView, AdminPerformanceView,
+    EmployeeRequiredMixin, EmployeePerformanceView, AdminPerformanceView, AdminPerformanceListView,
     EmployeeCreateView, EmployeeUpdateView, EmployeeDeleteView, EmployeeLeaveCreateView,
     EmployeeAttendanceListView, EmployeePayslipDetailView, EmployeeProfileView,
     PayrollUpdateView, LeaveUpdateView, AttendanceUpdateView
 )
 
+ADMIN_PERFORMANCE_LIST_URL = reverse_lazy('admin_performance_list')
+DASHBOARD_URL = reverse_lazy('dashboard')
+
+
+# (query params, field, expected value, expected count) for the five
+# employees created in AdminPerformanceViewTest
+_PERFORMANCE_LIST_FILTERS = (
+    ({'search': 'Employee 1'}, 'name', 'Test Employee 1', 1),
+    ({'department': 'IT'}, 'department', 'IT', 3),
+    ({'score_range': 'exceeds'}, 'predicted_score', 4, 1),
+)
+
 
 class EmployeeRequiredMixinTest(TestCase):
     """Test EmployeeRequiredMixin."""
 
-    def setUp(self):
-        self.factory = RequestFactory()
-
+    @classmethod
+    def setUpTestData(cls):
         # Create users
-        self.staff_user = User.objects.create_user(
+        cls.staff_user = User.objects.create_user(
             username='staff',
             password='password',
             is_staff=True
         )
 
-        self.employee_user = User.objects.create_user(
+        cls.employee_user = User.objects.create_user(
             username='employee',
             password='password',
             is_staff=False
         )
 
+        cls.factory = RequestFactory()
+
+    def setUp(self):
         # Create a test mixin instance
         class TestView(EmployeeRequiredMixin):
             def get(self, request):
@@ -55,7 +70,7 @@ class EmployeeRequiredMixinTest(TestCase):
         response = self.test_view.dispatch(request)
 
         # Should redirect to dashboard
-        self.assertEqual(response.url, reverse('dashboard'))
+        self.assertEqual(response.url, DASHBOARD_URL)
 
     def test_dispatch_employee_user(self):
         """Test dispatch allows employee users."""
@@ -75,22 +90,22 @@ class EmployeeRequiredMixinTest(TestCase):
         self.assertEqual(response, "success")
 
 
+@freeze_now()
 class EmployeePerformanceViewTest(TestCase):
     """Test EmployeePerformanceView."""
 
-    def setUp(self):
-        self.client = Client()
-
+    @classmethod
+    def setUpTestData(cls):
         # Create employee user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='employee',
             password='password',
             is_staff=False
         )
 
         # Create employee record
-        self.employee = Employee.objects.create(
-            user=self.user,
+        cls.employee = Employee.objects.create(
+            user=cls.user,
             name='Test Employee',
             emp_id='EMP001',
             department='IT',
@@ -109,16 +124,19 @@ class EmployeePerformanceViewTest(TestCase):
         )
 
         # Create attendance records
+        today = FROZEN_TODAY
+        eight_hours = Decimal('8.00')
         for i in range(5):
             Attendance.objects.create(
-                employee=self.employee,
-                date=timezone.now().date() - timezone.timedelta(days=i),
+                employee=cls.employee,
+                date=today - timezone.timedelta(days=i),
                 status='PRESENT' if i % 2 == 0 else 'LATE',
-                hours_worked=Decimal('8.00')
+                hours_worked=eight_hours
             )
 
+    def setUp(self):
         # Login
-        axes_login(self.client, 'employee', 'password')
+        fast_login(self.client, self.user)
 
     def test_get_object(self):
         """Test get_object returns employee for current user."""
@@ -142,8 +160,9 @@ class EmployeePerformanceViewTest(TestCase):
         view.request = request
         view.object = self.employee
 
-        # Get context
-        context = view.get_context_data()
+        # Get context; one GROUP BY status query covers every count
+        with self.assertNumQueries(1):
+            context = view.get_context_data()
 
         # Check if attendance_stats is in context
         self.assertIn('attendance_stats', context)
@@ -151,24 +170,64 @@ class EmployeePerformanceViewTest(TestCase):
         self.assertIn('late_days', context['attendance_stats'])
         self.assertIn('avg_hours', context['attendance_stats'])
 
+        # Statuses with no rows still report zero
+        self.assertEqual(context['attendance_stats']['absent_days'], 0)
+        self.assertEqual(context['attendance_stats']['avg_hours'], Decimal('8.00'))
+
+    @override_settings(CACHES={'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'employee-view-tests',
+    }})
+    def test_attendance_stats_cached_until_attendance_changes(self):
+        """Test monthly attendance counts are cached per employee until a write."""
+        cache.clear()
+        view = EmployeePerformanceView()
+        view.request = RequestFactory().get('/performance/')
+        view.request.user = self.user
+        view.object = self.employee
+        view.get_context_data()
+
+        with self.assertNumQueries(0):
+            context = view.get_context_data()
+        self.assertEqual(context['attendance_stats']['absent_days'], 0)
 
+        Attendance.objects.create(
+            employee=self.employee,
+            date=FROZEN_TODAY - timezone.timedelta(days=6),
+            status='ABSENT',
+            hours_worked=Decimal('0.00')
+        )
+        context = view.get_context_data()
+        self.assertEqual(context['attendance_stats']['absent_days'], 1)
+
+        # Losing the version counter must not bring back the first entry
+        cache.delete(f'attendance:ver:{self.employee.id}')
+        context = view.get_context_data()
+        self.assertEqual(context['attendance_stats']['absent_days'], 1)
+
+
+@freeze_now()
 class AdminPerformanceViewTest(TestCase):
     """Test AdminPerformanceView and AdminPerformanceListView."""
 
-    def setUp(self):
-        self.client = Client()
-
+    @classmethod
+    def setUpTestData(cls):
         # Create staff user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='staff',
             password='password',
             is_staff=True
         )
 
-        # Create employee records
-        self.employees = []
-        for i in range(5):
-            emp = Employee.objects.create(
+        # Shared values for the fixture rows, computed once
+        today = FROZEN_TODAY
+        eight_hours = Decimal('8.00')
+        sixty_k = Decimal('60000.00')
+
+        # Create employee records; bulk_create skips Employee.save(), so set
+        # the performance_score it would derive from predicted_score
+        Employee.objects.bulk_create([
+            Employee(
                 name=f'Test Employee {i}',
                 emp_id=f'EMP00{i}',
                 department='IT' if i % 2 == 0 else 'HR',
@@ -176,7 +235,7 @@ class AdminPerformanceViewTest(TestCase):
                 date_of_hire=date(2020, 1, 1),
                 gender='M',
                 marital_status='Single',
-                salary=Decimal('60000.00'),
+                salary=sixty_k,
                 engagement_survey=4.0,
                 emp_satisfaction=4,
                 special_projects_count=2,
@@ -184,59 +243,90 @@ class AdminPerformanceViewTest(TestCase):
                 absences=3,
                 hispanic_latino='No',
                 employment_status='Active',
-                predicted_score=i % 4 + 1  # Values 1-4
+                predicted_score=i % 4 + 1,  # Values 1-4
+                performance_score=Employee.SCORE_LABELS[i % 4 + 1]
             )
-            self.employees.append(emp)
+            for i in range(5)
+        ])
+        # Re-fetch so primary keys are set on backends that don't return them
+        cls.employees = list(Employee.objects.order_by('emp_id'))
 
-            # Create attendance records
-            for j in range(3):
-                Attendance.objects.create(
-                    employee=emp,
-                    date=timezone.now().date() - timezone.timedelta(days=j),
-                    status='PRESENT',
-                    hours_worked=Decimal('8.00')
-                )
+        # Create attendance records
+        Attendance.objects.bulk_create([
+            Attendance(
+                employee=emp,
+                date=today - timezone.timedelta(days=j),
+                status='PRESENT',
+                hours_worked=eight_hours
+            )
+            for emp in cls.employees
+            for j in range(3)
+        ], batch_size=500)
 
+        cls.factory = RequestFactory()
+
+    def setUp(self):
         # Login
-        axes_login(self.client, 'staff', 'password')
+        fast_login(self.client, self.user)
 
     def test_admin_performance_list_view_queryset(self):
         """Test AdminPerformanceListView.get_queryset with filters."""
-        response = self.client.get(reverse('admin_performance_list'))
+        # Session, user, summary aggregate (also the paginator count), one page
+        with self.assertNumQueries(4):
+            response = self.client.get(ADMIN_PERFORMANCE_LIST_URL)
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['paginator'].count, 5)
 
-        # Test with search filter
-        response = self.client.get(reverse('admin_performance_list'), {'search': 'Employee 1'})
-        self.assertEqual(len(response.context['employees']), 1)
-
-        # Test with department filter
-        response = self.client.get(reverse('admin_performance_list'), {'department': 'IT'})
-        self.assertTrue(all(e.department == 'IT' for e in response.context['employees']))
-
-        # Test with score range filter
-        response = self.client.get(reverse('admin_performance_list'), {'score_range': 'exceeds'})
-        self.assertTrue(all(e.predicted_score == 4 for e in response.context['employees']))
+        # Search, department and score range filters
+        for params, field, value, expected_count in _PERFORMANCE_LIST_FILTERS:
+            with self.subTest(**params):
+                response = self.client.get(ADMIN_PERFORMANCE_LIST_URL, params)
+                # len() reads the page the template already evaluated
+                employees = response.context['employees']
+                self.assertEqual(len(employees), expected_count)
+                self.assertTrue(all(getattr(e, field) == value for e in employees))
 
     def test_admin_performance_list_view_context(self):
         """Test AdminPerformanceListView.get_context_data."""
-        response = self.client.get(reverse('admin_performance_list'))
+        # Call the view directly; no middleware, session or template render
+        request = self.factory.get(ADMIN_PERFORMANCE_LIST_URL)
+        request.user = self.user
+        view = AdminPerformanceListView()
+        view.setup(request)
+        view.object_list = view.get_queryset()
+
+        context = view.get_context_data()
 
         # Check that summary statistics are in context
-        self.assertIn('avg_performance', response.context)
-        self.assertIn('top_performers_count', response.context)
-        self.assertIn('meets_expectations_count', response.context)
-        self.assertIn('needs_improvement_count', response.context)
-        self.assertIn('pip_count', response.context)
+        self.assertIn('avg_performance', context)
+        self.assertIn('top_performers_count', context)
+        self.assertIn('meets_expectations_count', context)
+        self.assertIn('needs_improvement_count', context)
+        self.assertIn('pip_count', context)
 
     def test_admin_performance_detail_view(self):
         """Test AdminPerformanceView.get_context_data."""
         employee = self.employees[0]
-        response = self.client.get(reverse('admin_performance_detail', args=[employee.pk]))
+        request = self.factory.get(cached_reverse('admin_performance_detail', employee.pk))
+        request.user = self.user
+        view = AdminPerformanceView()
+        view.setup(request, pk=employee.pk)
+
+        # Employee, then one grouped aggregate covering both months
+        with self.assertNumQueries(2):
+            view.object = view.get_object()
+            context = view.get_context_data(object=view.object)
 
         # Check that attendance stats are in context
-        self.assertIn('attendance_stats', response.context)
-        self.assertIn('current_month_stats', response.context)
-        self.assertIn('prev_month_stats', response.context)
+        self.assertIn('attendance_stats', context)
+        self.assertIn('current_month_stats', context)
+        self.assertIn('prev_month_stats', context)
 
         # Check attendance rate calculation
-        self.assertIn('attendance_rate', response.context['current_month_stats'])
\ No newline at end of file
+        self.assertIn('attendance_rate', context['current_month_stats'])
+
+        # Counts are plain integers, zero for a status or month with no rows
+        self.assertEqual(context['attendance_stats']['present_days'], 3)
+        self.assertEqual(context['attendance_stats']['absent_days'], 0)
+        self.assertEqual(context['prev_month_stats']['present_days'], 0)
+        self.assertEqual(context['prev_month_stats']['attendance_rate'], 0)
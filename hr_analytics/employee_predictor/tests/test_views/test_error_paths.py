@@ -1,29 +1,33 @@
 # employee_predictor/tests/test_views/test_error_paths.py
 
-from django.test import TestCase, Client
-from django.urls import reverse
+from django.test import TestCase
+from django.urls import reverse_lazy
 from django.contrib.auth.models import User
 from unittest.mock import patch, MagicMock
-from employee_predictor.tests.test_helper import axes_login
+from employee_predictor.tests.test_helper import fast_login
 from employee_predictor.models import Employee, Leave, Payroll
 
+EMPLOYEE_CREATE_URL = reverse_lazy('employee-create')
+
 
 class ViewErrorPathsTest(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create users and test data
-        self.staff_user = User.objects.create_user(
+        cls.staff_user = User.objects.create_user(
             username='staffuser',
             password='staffpassword',
             is_staff=True
         )
-        self.client = Client()
-        axes_login(self.client, 'staffuser', 'staffpassword')
+
+    def setUp(self):
+        fast_login(self.client, self.staff_user)
 
     def test_employee_create_view_validation_error(self):
         """Test EmployeeCreateView with validation errors."""
         # Submit with missing required fields
         response = self.client.post(
-            reverse('employee-create'),
+            EMPLOYEE_CREATE_URL,
             {'name': 'Test Employee'},  # Missing other required fields
             follow=True
         )
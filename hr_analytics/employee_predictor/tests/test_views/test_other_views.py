@@ -1,28 +1,37 @@
 # employee_predictor/tests/test_views/test_other_views.py
-from django.test import TestCase, Client, RequestFactory
-from django.urls import reverse
+from django.test import TestCase, RequestFactory
+from django.urls import reverse_lazy
 from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.contrib import messages
 from django.utils import timezone
 from decimal import Decimal
 from datetime import date, timedelta
 from unittest.mock import patch, MagicMock
 
-from employee_predictor.tests.test_helper import axes_login, add_message_middleware
+from employee_predictor.tests.test_helper import add_message_middleware, fast_login, cached_reverse
 from employee_predictor.models import Employee, Attendance, Leave, Payroll
 from employee_predictor.views import (
     employee_register, LeaveUpdateView, AttendanceUpdateView, PayrollUpdateView
 )
 
 
+REGISTER_URL = reverse_lazy('register')
+LOGIN_URL = reverse_lazy('login')
+LEAVE_LIST_URL = reverse_lazy('leave-list')
+ATTENDANCE_LIST_URL = reverse_lazy('attendance-list')
+PAYROLL_LIST_URL = reverse_lazy('payroll-list')
+PAYROLL_CREATE_URL = reverse_lazy('payroll-create')
+BULK_ATTENDANCE_URL = reverse_lazy('bulk-attendance')
+
+
 class EmployeeRegisterTest(TestCase):
     """Test employee_register view."""
 
-    def setUp(self):
-        self.client = Client()
-
+    @classmethod
+    def setUpTestData(cls):
         # Create employee record without user
-        self.employee = Employee.objects.create(
+        cls.employee = Employee.objects.create(
             name='Test Employee',
             emp_id='EMP001',
             department='IT',
@@ -50,10 +59,10 @@ class EmployeeRegisterTest(TestCase):
             'password2': 'ComplexPassword123'
         }
 
-        response = self.client.post(reverse('register'), data, follow=True)
+        response = self.client.post(REGISTER_URL, data)
 
         # Check redirect to login
-        self.assertRedirects(response, reverse('login'))
+        self.assertRedirects(response, LOGIN_URL, fetch_redirect_response=False)
 
         # Check user was created
         self.assertTrue(User.objects.filter(username='newuser').exists())
@@ -72,7 +81,7 @@ class EmployeeRegisterTest(TestCase):
             'password2': 'ComplexPassword123'
         }
 
-        response = self.client.post(reverse('register'), data)
+        response = self.client.post(REGISTER_URL, data)
 
         # Should stay on register page with errors
         self.assertEqual(response.status_code, 200)
@@ -85,18 +94,20 @@ class EmployeeRegisterTest(TestCase):
 class UpdateViewsTest(TestCase):
     """Test various Update views."""
 
-    def setUp(self):
-        self.client = Client()
+    @classmethod
+    def setUpTestData(cls):
+        # Computed once for every fixture date and test below
+        cls.today = today = timezone.localdate()
 
         # Create staff user
-        self.staff = User.objects.create_user(
+        cls.staff = User.objects.create_user(
             username='staff',
             password='password',
             is_staff=True
         )
 
         # Create employee
-        self.employee = Employee.objects.create(
+        cls.employee = Employee.objects.create(
             name='Test Employee',
             emp_id='EMP001',
             department='IT',
@@ -115,19 +126,19 @@ class UpdateViewsTest(TestCase):
         )
 
         # Create leave record
-        self.leave = Leave.objects.create(
-            employee=self.employee,
-            start_date=timezone.now().date() + timedelta(days=5),
-            end_date=timezone.now().date() + timedelta(days=7),
+        cls.leave = Leave.objects.create(
+            employee=cls.employee,
+            start_date=today + timedelta(days=5),
+            end_date=today + timedelta(days=7),
             leave_type='ANNUAL',
             status='PENDING',
             reason='Vacation'
         )
 
         # Create attendance record
-        self.attendance = Attendance.objects.create(
-            employee=self.employee,
-            date=timezone.now().date(),
+        cls.attendance = Attendance.objects.create(
+            employee=cls.employee,
+            date=today,
             status='PRESENT',
             check_in=timezone.now().time(),
             check_out=None,
@@ -135,8 +146,8 @@ class UpdateViewsTest(TestCase):
         )
 
         # Create payroll record
-        self.payroll = Payroll.objects.create(
-            employee=self.employee,
+        cls.payroll = Payroll.objects.create(
+            employee=cls.employee,
             period_start=date(2023, 1, 1),
             period_end=date(2023, 1, 31),
             basic_salary=Decimal('5000.00'),
@@ -144,8 +155,9 @@ class UpdateViewsTest(TestCase):
             status='DRAFT'
         )
 
+    def setUp(self):
         # Login as staff
-        axes_login(self.client, 'staff', 'password')
+        fast_login(self.client, self.staff)
 
     def test_leave_update_view(self):
         """Test LeaveUpdateView.form_valid."""
@@ -161,21 +173,20 @@ class UpdateViewsTest(TestCase):
         # Create form with updated data
         form_data = {
             'employee': self.employee.id,
-            'start_date': (timezone.now().date() + timedelta(days=6)).strftime('%Y-%m-%d'),
-            'end_date': (timezone.now().date() + timedelta(days=8)).strftime('%Y-%m-%d'),
+            'start_date': (self.today + timedelta(days=6)).strftime('%Y-%m-%d'),
+            'end_date': (self.today + timedelta(days=8)).strftime('%Y-%m-%d'),
             'leave_type': 'SICK',
             'reason': 'Updated reason'
         }
 
         # Update leave through the view
         response = self.client.post(
-            reverse('leave-update', args=[self.leave.id]),
-            form_data,
-            follow=True
+            cached_reverse('leave-update', self.leave.id),
+            form_data
         )
 
         # Check redirect
-        self.assertRedirects(response, reverse('leave-list'))
+        self.assertRedirects(response, LEAVE_LIST_URL, fetch_redirect_response=False)
 
         # Check leave was updated
         self.leave.refresh_from_db()
@@ -187,7 +198,7 @@ class UpdateViewsTest(TestCase):
         # Update attendance through the view
         form_data = {
             'employee': self.employee.id,
-            'date': timezone.now().date().strftime('%Y-%m-%d'),
+            'date': self.today.strftime('%Y-%m-%d'),
             'status': 'PRESENT',
             'check_in': '09:00',
             'check_out': '17:00',
@@ -195,13 +206,12 @@ class UpdateViewsTest(TestCase):
         }
 
         response = self.client.post(
-            reverse('attendance-update', args=[self.attendance.id]),
-            form_data,
-            follow=True
+            cached_reverse('attendance-update', self.attendance.id),
+            form_data
         )
 
         # Check redirect
-        self.assertRedirects(response, reverse('attendance-list'))
+        self.assertRedirects(response, ATTENDANCE_LIST_URL, fetch_redirect_response=False)
 
         # Check attendance was updated
         self.attendance.refresh_from_db()
@@ -209,6 +219,82 @@ class UpdateViewsTest(TestCase):
         self.assertIsNotNone(self.attendance.check_out)
         self.assertEqual(self.attendance.hours_worked, Decimal('8.00'))
 
+    def test_payroll_list_totals(self):
+        """PayrollListView counts and totals the filtered rows in one aggregate."""
+        # Session, user, the totals aggregate and the page
+        with self.assertNumQueries(4):
+            response = self.client.get(PAYROLL_LIST_URL, {'month': 1, 'year': 2023})
+
+        self.assertEqual(response.context['total_payroll'], {'total': Decimal('5000.00'), 'count': 1})
+        self.assertEqual(response.context['paginator'].count, 1)
+
+        # Other months, and months that don't exist, match nothing
+        for month in (2, 13):
+            response = self.client.get(PAYROLL_LIST_URL, {'month': month, 'year': 2023})
+            self.assertEqual(response.context['paginator'].count, 0)
+
+    def test_payroll_create_attendance_summary(self):
+        """PayrollCreateView sums the month's present days and hours in one aggregate."""
+        Attendance.objects.filter(pk=self.attendance.pk).update(hours_worked=Decimal('10.00'))
+
+        response = self.client.get(PAYROLL_CREATE_URL, {'employee': self.employee.id})
+
+        self.assertEqual(response.context['attendance_summary'], {
+            'working_days': 1,
+            'total_hours': Decimal('10.00'),
+            'overtime_hours': Decimal('2.00')
+        })
+
+    def test_bulk_attendance_upload_missing_columns(self):
+        """A CSV without the employee_id/status columns is reported, not imported."""
+        bad_csv = SimpleUploadedFile("bad.csv", b"invalid,csv,format", content_type="text/csv")
+
+        response = self.client.post(
+            BULK_ATTENDANCE_URL,
+            {'date': self.today.strftime('%Y-%m-%d'), 'csv_file': bad_csv}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        sent = [(m.level, m.message) for m in messages.get_messages(response.wsgi_request)]
+        self.assertEqual(sent, [
+            (messages.ERROR, 'Error processing file: missing column(s): employee_id, status')
+        ])
+
+    def test_payroll_detail_attendance_stats(self):
+        """PayrollDetailView derives its statistics from the fetched attendance rows."""
+        Payroll.objects.filter(pk=self.payroll.pk).update(
+            period_start=self.today, period_end=self.today
+        )
+
+        # Session, user, the payroll with its employee and the attendance rows
+        with self.assertNumQueries(4):
+            response = self.client.get(cached_reverse('payroll-detail', self.payroll.id))
+
+        self.assertEqual(response.context['attendance_records'], [self.attendance])
+        self.assertEqual(response.context['attendance_stats'], {
+            'present_days': 1,
+            'absent_days': 0,
+            'late_days': 0,
+            'leave_days': 0,
+            'total_hours': Decimal('0.00'),
+        })
+
+    def test_process_payroll(self):
+        """Test process_payroll approves a draft once and leaves it alone after."""
+        response = self.client.get(cached_reverse('payroll-process', self.payroll.id))
+        self.assertRedirects(
+            response, cached_reverse('payroll-detail', self.payroll.id), fetch_redirect_response=False
+        )
+
+        self.payroll.refresh_from_db()
+        self.assertEqual(self.payroll.status, 'APPROVED')
+        self.assertEqual(self.payroll.payment_date, timezone.now().date())
+
+        # A repeated request finds the payroll already approved
+        response = self.client.get(cached_reverse('payroll-process', self.payroll.id))
+        sent = [m.message for m in messages.get_messages(response.wsgi_request)]
+        self.assertEqual(sent.count('Payroll processed successfully.'), 1)
+
     def test_payroll_update_view_dispatching(self):
         """Test PayrollUpdateView.dispatch with non-draft payroll."""
         # Change payroll status to non-draft
@@ -217,16 +303,15 @@ class UpdateViewsTest(TestCase):
 
         # Try to access update view
         response = self.client.get(
-            reverse('payroll-update', args=[self.payroll.id]),
-            follow=True
+            cached_reverse('payroll-update', self.payroll.id)
         )
 
         # Should redirect to payroll list
-        self.assertRedirects(response, reverse('payroll-list'))
+        self.assertRedirects(response, PAYROLL_LIST_URL, fetch_redirect_response=False)
 
         # Should show error message
-        messages_list = list(response.context['messages'])
-        self.assertTrue(any('Only draft payrolls can be edited' in str(m) for m in messages_list))
+        sent = {(m.level, m.message) for m in messages.get_messages(response.wsgi_request)}
+        self.assertIn((messages.ERROR, 'Only draft payrolls can be edited.'), sent)
 
     def test_payroll_update_view(self):
         """Test PayrollUpdateView.form_valid."""
@@ -244,13 +329,12 @@ class UpdateViewsTest(TestCase):
         }
 
         response = self.client.post(
-            reverse('payroll-update', args=[self.payroll.id]),
-            form_data,
-            follow=True
+            cached_reverse('payroll-update', self.payroll.id),
+            form_data
         )
 
         # Check redirect
-        self.assertRedirects(response, reverse('payroll-list'))
+        self.assertRedirects(response, PAYROLL_LIST_URL, fetch_redirect_response=False)
 
         # Check payroll was updated
         self.payroll.refresh_from_db()
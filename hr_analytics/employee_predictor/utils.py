@@ -2,48 +2,57 @@
 from decimal import Decimal
 from datetime import datetime, date, timedelta
 from django.db.models import Sum, Count, Q
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from .models import Attendance, Leave
 
+# Money and hours are kept as Decimal and quantized to cents
+CENTS = Decimal('0.01')
+HOURS_PER_DAY = Decimal('8')  # 8 hours per working day
+WORKING_DAYS_PER_MONTH = Decimal('22')  # Assuming 22 working days
+# Only these statuses carry hours; ABSENT and ON_LEAVE rows are zero
+WORKED_STATUSES = ('PRESENT', 'LATE', 'HALF_DAY')
 
-def calculate_payroll_details(employee, start_date, end_date):
-    """Calculate payroll details for an employee within a date range"""
 
-    # Get attendance records
-    attendance_records = Attendance.objects.filter(
-        employee=employee,
-        date__range=[start_date, end_date]
-    )
+def calculate_payroll_details(employee_id, salary, start_date, end_date):
+    """Calculate payroll details for an employee within a date range
+
+    Takes the employee's id and salary rather than the instance, so callers
+    can pass values they already loaded; the attendance statistics come from
+    a single aggregate query.
+    """
 
     # Calculate attendance statistics
-    attendance_stats = attendance_records.aggregate(
+    attendance_stats = Attendance.objects.filter(
+        employee_id=employee_id,
+        date__range=[start_date, end_date]
+    ).aggregate(
         present_days=Count('id', filter=Q(status='PRESENT')),
         absent_days=Count('id', filter=Q(status='ABSENT')),
         late_days=Count('id', filter=Q(status='LATE')),
-        total_hours=Sum('hours_worked')
+        total_hours=Coalesce(Sum('hours_worked', filter=Q(status__in=WORKED_STATUSES)), Decimal('0'))
     )
 
     # Convert None values to 0
     attendance_stats = {k: v or 0 for k, v in attendance_stats.items()}
 
     # Calculate overtime hours
-    regular_hours = attendance_stats['present_days'] * 8  # 8 hours per working day
-    total_hours = float(attendance_stats['total_hours'])
-    overtime_hours = max(0, total_hours - regular_hours)
+    regular_hours = Decimal(attendance_stats['present_days']) * HOURS_PER_DAY
+    total_hours = attendance_stats['total_hours'] or Decimal('0')
+    overtime_hours = max(Decimal('0'), total_hours - regular_hours)
 
     # Calculate base overtime rate (1.5 times hourly rate)
-    daily_rate = float(employee.salary) / 22  # Assuming 22 working days
-    hourly_rate = daily_rate / 8
-    overtime_rate = hourly_rate * 1.5
+    daily_rate = salary / WORKING_DAYS_PER_MONTH
+    hourly_rate = daily_rate / HOURS_PER_DAY
+    overtime_rate = hourly_rate * Decimal('1.5')
 
     # Calculate tax (simplified example - customize according to your tax rules)
-    monthly_salary = float(employee.salary)
-    tax_rate = 0.15 if monthly_salary > 5000 else 0.1  # Example tax brackets
-    estimated_tax = monthly_salary * tax_rate
+    tax_rate = Decimal('0.15') if salary > Decimal('5000') else Decimal('0.1')  # Example tax brackets
+    estimated_tax = salary * tax_rate
 
     return {
         'attendance_stats': attendance_stats,
-        'overtime_hours': round(overtime_hours, 2),
-        'overtime_rate': round(overtime_rate, 2),
-        'estimated_tax': round(estimated_tax, 2),
+        'overtime_hours': overtime_hours.quantize(CENTS),
+        'overtime_rate': overtime_rate.quantize(CENTS),
+        'estimated_tax': estimated_tax.quantize(CENTS),
     }
\ No newline at end of file
@@ -28,15 +28,30 @@ from django.views.generic import ListView, DetailView, CreateView, UpdateView, T
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.admin.views.decorators import staff_member_required
+from django.core.cache import cache
+from django.core.paginator import Paginator
 from django.shortcuts import render, redirect, get_object_or_404
+from django.http import Http404
 from django.urls import reverse_lazy
-from django.db.models import Sum, Avg, Count, Q
+from django.db import transaction
+from django.db.models import Sum, Avg, Count, Q, Case, When, Value, CharField
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.contrib import messages
-from datetime import timedelta
-import pandas as pd
+import calendar
+import csv
+import io
+from collections import Counter
+from datetime import date, timedelta
+from decimal import Decimal
+import threading
 
 from . import forms
+from .aggregations import (
+    ATTENDANCE_CACHE_TIMEOUT, DASHBOARD_CACHE_TIMEOUT, attendance_cache_key, attendance_stats,
+    attendance_status_counts, dashboard_cache_key, employee_attendance_counts, employee_departments,
+    invalidate_attendance_cache, invalidate_dashboard_cache
+)
 from .ml.enhanced_predictor import EnhancedPerformancePredictor  # CORRECT IMPORT
 from .models import Employee, Attendance, Leave, Payroll
 from .forms import (
@@ -47,6 +62,55 @@ from .forms import (
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# One predictor per process: constructing it loads the model files from disk
+_predictor = None
+_predictor_lock = threading.Lock()
+
+
+def get_predictor():
+    """Return the shared EnhancedPerformancePredictor, creating it on first use.
+
+    A predictor whose model failed to load is not kept, so a process started
+    before the model was trained picks it up on a later request.
+    """
+    global _predictor
+    predictor = _predictor
+    if predictor is None:
+        with _predictor_lock:
+            predictor = _predictor
+            if predictor is None:
+                predictor = EnhancedPerformancePredictor()
+                if predictor.model is not None:
+                    _predictor = predictor
+    return predictor
+
+
+# score_range query values accepted by AdminPerformanceListView
+SCORE_RANGES = {
+    'exceeds': 4,
+    'fully_meets': 3,
+    'needs_improvement': 2,
+    'improvement_plan': 1,
+}
+
+# Predicted scores in display order
+_SCORE_ORDER = (1, 2, 3, 4)
+
+
+def _month_range(year, month):
+    """First and last day of a month, for index-friendly date__range filters."""
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+class KnownCountPaginator(Paginator):
+    """Paginator that takes the row count from the caller instead of running COUNT(*)."""
+
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            # Paginator.count is a cached_property; pre-seed its cache
+            self.__dict__['count'] = count
+
 # Mixins
 class StaffRequiredMixin(UserPassesTestMixin):
     """Verify that the current user is staff."""
@@ -55,7 +119,31 @@ class StaffRequiredMixin(UserPassesTestMixin):
         return self.request.user.is_staff
 
 
-class EmployeeRequiredMixin(LoginRequiredMixin):
+class EmployeeRecordMixin:
+    """Look up the current user's Employee record once per view instance.
+
+    Views that only need the key can narrow the SELECT with employee_fields;
+    reading any other attribute of the record then costs a query per field.
+    """
+    employee_fields = None
+
+    @cached_property
+    def employee(self):
+        if self.employee_fields:
+            employee = Employee.objects.filter(
+                user=self.request.user
+            ).only(*self.employee_fields).first()
+            if employee is not None:
+                # The user row is already loaded; reuse it rather than select_related
+                employee.user = self.request.user
+            return employee
+
+        # The reverse one-to-one accessor caches the record on the user (and
+        # the user on the record); None when the user has no employee record
+        return getattr(self.request.user, 'employee', None)
+
+
+class EmployeeRequiredMixin(EmployeeRecordMixin, LoginRequiredMixin):
     """Verify that the current user is authenticated and is not staff."""
 
     def dispatch(self, request, *args, **kwargs):
@@ -72,13 +160,15 @@ from datetime import timedelta
 from django.db.models import Count, Avg, Q
 from .models import Employee, Attendance
 
-class EmployeePerformanceView(LoginRequiredMixin, DetailView):
+class EmployeePerformanceView(EmployeeRequiredMixin, DetailView):
     model = Employee
     template_name = 'employee_predictor/employee_portal/performance_detail.html'
     context_object_name = 'employee'
 
     def get_object(self):
-        return Employee.objects.get(user=self.request.user)
+        if self.employee is None:
+            raise Http404('No employee record found for your account.')
+        return self.employee
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -86,16 +176,8 @@ class EmployeePerformanceView(LoginRequiredMixin, DetailView):
         month_start = today.replace(day=1)
 
         # Get attendance statistics for current month
-        context['attendance_stats'] = Attendance.objects.filter(
-            employee=self.object,
-            date__gte=month_start,
-            date__lte=today
-        ).aggregate(
-            present_days=Count('id', filter=Q(status='PRESENT')),
-            late_days=Count('id', filter=Q(status='LATE')),
-            absent_days=Count('id', filter=Q(status='ABSENT')),
-            on_leave_days=Count('id', filter=Q(status='ON_LEAVE')),
-            avg_hours=Avg('hours_worked')
+        context['attendance_stats'] = attendance_stats(
+            employee_attendance_counts(self.object.pk, month_start, today), suffix='_days'
         )
 
         return context
@@ -106,9 +188,17 @@ class AdminPerformanceListView(StaffRequiredMixin, ListView):
     template_name = 'employee_predictor/performance_list.html'
     context_object_name = 'employees'
     paginate_by = 10
+    paginator_class = KnownCountPaginator
+
+    # Columns the list template renders; prediction_details and the other
+    # wide columns are left out of the page query
+    list_fields = (
+        'name', 'emp_id', 'department', 'predicted_score', 'engagement_survey',
+        'special_projects_count', 'prediction_date',
+    )
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = super().get_queryset().only(*self.list_fields)
 
         # Search filter
         search_query = self.request.GET.get('search', '').strip()
@@ -125,51 +215,37 @@ class AdminPerformanceListView(StaffRequiredMixin, ListView):
 
         # Score range filter
         score_range = self.request.GET.get('score_range', '').strip()
-        if score_range:
-            if score_range == 'exceeds':
-                queryset = queryset.filter(predicted_score=4.0)
-            elif score_range == 'fully_meets':
-                queryset = queryset.filter(predicted_score=3.0)
+        if score_range == 'pending':
+            queryset = queryset.filter(predicted_score__isnull=True)
+        elif score_range in SCORE_RANGES:
+            queryset = queryset.filter(predicted_score=SCORE_RANGES[score_range])
 
-            elif score_range == 'needs_improvement':
-                queryset = queryset.filter(predicted_score=2.0)
+        return queryset.order_by('name')
 
-            elif score_range == 'improvement_plan':
-                queryset = queryset.filter(predicted_score=1.0)
-            elif score_range == 'pending':
-                queryset = queryset.filter(predicted_score__isnull=True)
+    @cached_property
+    def summary_stats(self):
+        # Summary statistics over the whole filtered set (before pagination),
+        # reusing the ListView's queryset and computed in a single query.
+        # Avg ignores NULL scores, so pending reviews don't skew it.
+        return self.object_list.aggregate(
+            total_count=Count('id'),
+            avg_performance=Avg('predicted_score'),
+            top_performers_count=Count('id', filter=Q(predicted_score=4)),
+            meets_expectations_count=Count('id', filter=Q(predicted_score=3)),
+            needs_improvement_count=Count('id', filter=Q(predicted_score=2)),
+            pip_count=Count('id', filter=Q(predicted_score=1)),
+            pending_reviews_count=Count('id', filter=Q(predicted_score__isnull=True)),
+        )
 
-        return queryset.order_by('name')
+    def get_paginator(self, queryset, per_page, **kwargs):
+        # The summary aggregate already counts the filtered rows
+        return super().get_paginator(
+            queryset, per_page, count=self.summary_stats['total_count'], **kwargs
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-
-        # Get all employees for statistics (before pagination)
-        all_employees = self.get_queryset()
-
-        # Calculate summary statistics
-        context.update({
-            'avg_performance': all_employees.exclude(
-                predicted_score__isnull=True
-            ).aggregate(
-                avg=Avg('predicted_score')
-            )['avg'],
-            'top_performers_count': all_employees.filter(
-                predicted_score=4
-            ).count(),
-            'meets_expectations_count': all_employees.filter(
-                predicted_score=3
-            ).count(),
-            'needs_improvement_count': all_employees.filter(
-                predicted_score=2
-            ).count(),
-            'pip_count': all_employees.filter(
-                predicted_score=1
-            ).count(),
-            'pending_reviews_count': all_employees.filter(
-                predicted_score__isnull=True
-            ).count(),
-        })
+        context.update(self.summary_stats)
 
         # Add filter parameters to context for form persistence
         context.update({
@@ -193,50 +269,41 @@ class AdminPerformanceView(StaffRequiredMixin, DetailView):
         prev_month_start = prev_month_end.replace(day=1)
         employee = self.object
 
-        # Current month statistics
-        current_month_stats = Attendance.objects.filter(
-            employee=employee,
-            date__range=[current_month_start, today]
-        ).aggregate(
-            present_days=Count('id', filter=Q(status='PRESENT')),
-            late_days=Count('id', filter=Q(status='LATE')),
-            absent_days=Count('id', filter=Q(status='ABSENT')),
-            on_leave_days=Count('id', filter=Q(status='ON_LEAVE')),
-            avg_hours=Avg('hours_worked')
+        # Both months' statistics in one query, grouped by month bucket and
+        # status and cached until the employee's attendance changes; a month
+        # with no records gets zero counts
+        month_counts = cache.get_or_set(
+            attendance_cache_key(employee.pk, 'months', prev_month_start, today),
+            lambda: attendance_status_counts(
+                Attendance.objects.filter(
+                    employee=employee,
+                    date__range=[prev_month_start, today]
+                ).annotate(
+                    bucket=Case(
+                        When(date__gte=current_month_start, then=Value('current')),
+                        default=Value('prev'),
+                        output_field=CharField()
+                    )
+                ),
+                group_by='bucket'
+            ),
+            ATTENDANCE_CACHE_TIMEOUT
         )
+        # attendance_stats() reports 0 for statuses with no rows, so the counts
+        # need no None handling here or in the templates
+        current_month_stats = attendance_stats(month_counts.get('current', {}), suffix='_days')
+        prev_month_stats = attendance_stats(month_counts.get('prev', {}), suffix='_days')
 
-        # Calculate attendance rate
+        # Attendance rate over the days elapsed this month and the whole of
+        # last month; both spans are at least one day long
         working_days = (today - current_month_start).days + 1
-        present_days = current_month_stats['present_days'] or 0
-        current_month_stats['attendance_rate'] = (present_days / working_days) * 100 if working_days > 0 else 0
-
-        # Previous month statistics
-        prev_month_stats = Attendance.objects.filter(
-            employee=employee,
-            date__range=[prev_month_start, prev_month_end]
-        ).aggregate(
-            present_days=Count('id', filter=Q(status='PRESENT')),
-            late_days=Count('id', filter=Q(status='LATE')),
-            absent_days=Count('id', filter=Q(status='ABSENT')),
-            on_leave_days=Count('id', filter=Q(status='ON_LEAVE')),
-            avg_hours=Avg('hours_worked')
-        )
+        current_month_stats['attendance_rate'] = current_month_stats['present_days'] / working_days * 100
 
-        # Calculate previous month attendance rate
         prev_month_working_days = (prev_month_end - prev_month_start).days + 1
-        prev_month_present_days = prev_month_stats['present_days'] or 0
-        prev_month_stats['attendance_rate'] = (prev_month_present_days / prev_month_working_days) * 100 if prev_month_working_days > 0 else 0
-
-        # Make sure all values exist to prevent template errors
-        attendance_stats = {
-            'present_days': current_month_stats['present_days'] or 0,
-            'late_days': current_month_stats['late_days'] or 0,
-            'absent_days': current_month_stats['absent_days'] or 0,
-            'on_leave_days': current_month_stats['on_leave_days'] or 0,
-        }
+        prev_month_stats['attendance_rate'] = prev_month_stats['present_days'] / prev_month_working_days * 100
 
         context.update({
-            'attendance_stats': attendance_stats,
+            'attendance_stats': current_month_stats,
             'current_month_stats': current_month_stats,
             'prev_month_stats': prev_month_stats,
         })
@@ -268,7 +335,7 @@ class EmployeeListView(StaffRequiredMixin, ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['departments'] = Employee.objects.values_list('department', flat=True).distinct()
+        context['departments'] = employee_departments()
         return context
 
 
@@ -353,39 +420,50 @@ class DashboardView(LoginRequiredMixin, TemplateView):
         context = super().get_context_data(**kwargs)
         today = timezone.now().date()
 
-        # Employee statistics
-        context['total_employees'] = Employee.objects.count()
-        context['departments'] = Employee.objects.values('department').annotate(
+        # The aggregates only change on writes, which bump the cache version
+        # (see signals.py), or when the date in the key rolls over
+        context.update(cache.get_or_set(
+            dashboard_cache_key(today),
+            lambda: self.get_dashboard_stats(today),
+            DASHBOARD_CACHE_TIMEOUT
+        ))
+
+        return context
+
+    def get_dashboard_stats(self, today):
+        stats = {}
+
+        # Employee statistics; every employee falls in one department group,
+        # so the total is summed from the breakdown instead of a second COUNT
+        stats['departments'] = list(Employee.objects.values('department').annotate(
             count=Count('id'),
             avg_salary=Avg('salary')
-        )
+        ).order_by('department'))
+        stats['total_employees'] = sum(d['count'] for d in stats['departments'])
 
         # Today's attendance
-        context['today_attendance'] = Attendance.objects.filter(date=today).aggregate(
-            present=Count('id', filter=Q(status='PRESENT')),
-            absent=Count('id', filter=Q(status='ABSENT')),
-            late=Count('id', filter=Q(status='LATE')),
-            on_leave=Count('id', filter=Q(status='ON_LEAVE'))
+        stats['today_attendance'] = attendance_stats(
+            attendance_status_counts(Attendance.objects.filter(date=today))
         )
 
-        # Pending leaves
-        context['pending_leaves'] = Leave.objects.filter(status='PENDING').count()
-        context['active_leaves'] = Leave.objects.filter(
-            status='APPROVED',
-            start_date__lte=today,
-            end_date__gte=today
-        ).count()
+        # Pending leaves and leaves running today, counted in one query
+        active = Q(status='APPROVED', start_date__lte=today, end_date__gte=today)
+        leave_counts = Leave.objects.filter(Q(status='PENDING') | active).aggregate(
+            pending=Count('id', filter=Q(status='PENDING')),
+            active=Count('id', filter=active)
+        )
+        stats['pending_leaves'] = leave_counts['pending']
+        stats['active_leaves'] = leave_counts['active']
 
         # Payroll statistics for current month
-        context['payroll_stats'] = Payroll.objects.filter(
-            period_start__month=today.month,
-            period_start__year=today.year
+        stats['payroll_stats'] = Payroll.objects.filter(
+            period_start__range=_month_range(today.year, today.month)
         ).aggregate(
             total=Sum('net_salary'),
             count=Count('id')
         )
 
-        return context
+        return stats
 '''
 # Admin/Manager Views
 class DashboardView(StaffRequiredMixin, TemplateView):
@@ -478,12 +556,16 @@ class EmployeePredictionView(StaffRequiredMixin, UpdateView):
             # Prepare data for prediction with proper error handling
             employee_data = self._prepare_employee_data(employee)
 
-            # Make prediction using enhanced predictor
-            predictor = EnhancedPerformancePredictor()
+            # Make prediction using the shared enhanced predictor. This runs
+            # in the request: the project has no task queue or broker, and
+            # the redirect shows the result in the success message. The model
+            # is loaded once per process (get_predictor), so what remains is
+            # the inference itself.
+            predictor = get_predictor()
             prediction_results = predictor.predict_with_probability(employee_data)
 
             # Save prediction results
-            self._save_prediction_results(employee, prediction_results)
+            self._save_prediction_results(employee, prediction_results, form.changed_data)
 
             # Create success message with detailed information
             self._create_success_message(prediction_results)
@@ -525,21 +607,14 @@ class EmployeePredictionView(StaffRequiredMixin, UpdateView):
                 'employment_status': employee.employment_status
             }
 
-            # Log the data being used for prediction (excluding sensitive info)
-            logger.info(f"Preparing prediction for employee {employee.emp_id}")
-            logger.debug(f"Key metrics - Engagement: {employee_data['engagement_survey']}, "
-                         f"Satisfaction: {employee_data['emp_satisfaction']}, "
-                         f"Absences: {employee_data['absences']}, "
-                         f"Days Late: {employee_data['days_late_last_30']}")
-
             return employee_data
 
         except Exception as e:
             logger.error(f"Error preparing employee data: {str(e)}")
             raise Exception(f"Failed to prepare employee data for prediction: {str(e)}")
 
-    def _save_prediction_results(self, employee, prediction_results):
-        """Save prediction results to employee object"""
+    def _save_prediction_results(self, employee, prediction_results, changed_fields=()):
+        """Save prediction results, plus any fields the form changed, to employee"""
         try:
             if not prediction_results or 'prediction' not in prediction_results:
                 raise Exception("Invalid prediction results received")
@@ -553,34 +628,39 @@ class EmployeePredictionView(StaffRequiredMixin, UpdateView):
             if probabilities and employee.predicted_score in probabilities:
                 employee.prediction_confidence = probabilities[employee.predicted_score]
 
-            # Save detailed prediction information as JSON
-            import json
-            employee.prediction_details = json.dumps({
+            # Save detailed prediction information; the JSONField encodes it
+            employee.prediction_details = {
                 'prediction_score': prediction_results['prediction'],
                 'prediction_label': prediction_results.get('prediction_label', ''),
                 'probabilities': probabilities,
                 'key_factors': prediction_results.get('key_factors', []),
                 'prediction_method': 'enhanced_predictor',
                 'timestamp': timezone.now().isoformat()
-            })
-
-            # Map prediction score to performance_score field for database compatibility
-            score_mapping = {
-                1: 'PIP',
-                2: 'Needs Improvement',
-                3: 'Fully Meets',
-                4: 'Exceeds'
             }
 
-            if employee.predicted_score in score_mapping:
-                employee.performance_score = score_mapping[employee.predicted_score]
-
-            # Save the employee object
-            employee.save()
-
-            logger.info(f"Prediction saved for employee {employee.emp_id}: "
-                        f"Score={employee.predicted_score}, "
-                        f"Performance={employee.performance_score}")
+            # Map prediction score to performance_score field for database compatibility
+            if employee.predicted_score in Employee.SCORE_LABELS:
+                employee.performance_score = Employee.SCORE_LABELS[employee.predicted_score]
+
+            # Write only the prediction columns and the fields the form
+            # actually changed, not every column of the row
+            employee.save(update_fields={*changed_fields, *Employee.PREDICTION_FIELDS})
+
+            # One record per prediction: the message is formatted only if
+            # emitted, and the key metrics travel as fields in extra
+            logger.info(
+                "Prediction saved for employee %s: Score=%s, Performance=%s",
+                employee.emp_id, employee.predicted_score, employee.performance_score,
+                extra={
+                    'emp_id': employee.emp_id,
+                    'predicted_score': employee.predicted_score,
+                    'performance_score': employee.performance_score,
+                    'engagement_survey': employee.engagement_survey,
+                    'emp_satisfaction': employee.emp_satisfaction,
+                    'absences': employee.absences,
+                    'days_late_last_30': employee.days_late_last_30,
+                }
+            )
 
         except Exception as e:
             logger.error(f"Error saving prediction results: {str(e)}")
@@ -599,12 +679,11 @@ class EmployeePredictionView(StaffRequiredMixin, UpdateView):
 
             # Add probability information
             if probabilities:
-                prob_strings = []
-                for score in sorted(probabilities.keys()):
-                    label_mapping = {1: "PIP", 2: "Needs Improvement", 3: "Fully Meets", 4: "Exceeds"}
-                    label = label_mapping.get(score, f"Score {score}")
-                    prob = probabilities[score] * 100
-                    prob_strings.append(f"{label}: {prob:.1f}%")
+                prob_strings = [
+                    f"{Employee.SCORE_LABELS[score]}: {probabilities[score] * 100:.1f}%"
+                    for score in _SCORE_ORDER
+                    if score in probabilities
+                ]
 
                 prob_message = "Probabilities: " + ", ".join(prob_strings)
             else:
@@ -619,13 +698,9 @@ class EmployeePredictionView(StaffRequiredMixin, UpdateView):
             # Create combined message
             full_message = f"{main_message}. {prob_message}. {factors_message}"
 
+            # One message; the probabilities and factors are already part of it
             messages.success(self.request, full_message)
 
-            # Also add individual messages for better readability
-            messages.info(self.request, prob_message)
-            if key_factors:
-                messages.info(self.request, factors_message)
-
         except Exception as e:
             logger.error(f"Error creating success message: {str(e)}")
             # Fallback to simple message
@@ -637,7 +712,7 @@ class EmployeePredictionView(StaffRequiredMixin, UpdateView):
 
         # Add information about the prediction process
         context['prediction_info'] = {
-            'model_available': hasattr(self, '_check_model_availability') and self._check_model_availability(),
+            'model_available': self._check_model_availability(),
             'last_prediction': self.object.prediction_date,
             'current_score': self.object.predicted_score,
             'performance_mapping': {
@@ -652,12 +727,10 @@ class EmployeePredictionView(StaffRequiredMixin, UpdateView):
 
     def _check_model_availability(self):
         """Check if ML model is available"""
-        try:
-            from .ml.enhanced_predictor import EnhancedPerformancePredictor
-            predictor = EnhancedPerformancePredictor()
-            return predictor.model is not None
-        except:
-            return False
+        # The shared predictor loads its model files once per process and
+        # handles load errors itself, so after the first call this is a
+        # plain attribute read
+        return get_predictor().model is not None
 
 
 # Employee Portal Views
@@ -666,20 +739,14 @@ class EmployeePortalView(EmployeeRequiredMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        try:
-            employee = Employee.objects.get(user=self.request.user)
+        employee = self.employee
+        if employee is not None:
             today = timezone.now().date()
             month_start = today.replace(day=1)
 
             # Get attendance statistics
-            context['attendance_stats'] = Attendance.objects.filter(
-                employee=employee,
-                date__range=[month_start, today]
-            ).aggregate(
-                present=Count('id', filter=Q(status='PRESENT')),
-                absent=Count('id', filter=Q(status='ABSENT')),
-                late=Count('id', filter=Q(status='LATE')),
-                on_leave=Count('id', filter=Q(status='ON_LEAVE'))
+            context['attendance_stats'] = attendance_stats(
+                employee_attendance_counts(employee.pk, month_start, today)
             )
 
             # Get pending leave requests
@@ -704,7 +771,7 @@ class EmployeePortalView(EmployeeRequiredMixin, TemplateView):
             context['employee'] = employee
             context['month_name'] = today.strftime('%B %Y')
 
-        except Employee.DoesNotExist:
+        else:
             messages.error(self.request, 'No employee record found for your account.')
 
         return context
@@ -716,11 +783,10 @@ class EmployeeLeaveListView(EmployeeRequiredMixin, ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        try:
-            employee = Employee.objects.get(user=self.request.user)
-            return Leave.objects.filter(employee=employee).order_by('-start_date')
-        except Employee.DoesNotExist:
-            return Leave.objects.none()
+        # Filter through the user join, as EmployeeAttendanceListView does
+        return Leave.objects.filter(
+            employee__user=self.request.user
+        ).order_by('-start_date')
 
 
 '''class EmployeeLeaveCreateView(EmployeeRequiredMixin, CreateView):
@@ -742,20 +808,21 @@ class EmployeeLeaveListView(EmployeeRequiredMixin, ListView):
         messages.success(self.request, 'Leave request submitted successfully.')
         return super().form_valid(form)'''
 
-class EmployeeLeaveCreateView(LoginRequiredMixin, CreateView):
+class EmployeeLeaveCreateView(EmployeeRecordMixin, LoginRequiredMixin, CreateView):
     model = Leave
     form_class = LeaveForm
     template_name = 'employee_predictor/employee_portal/leave_form.html'
     success_url = reverse_lazy('employee-leaves')
+    # The record is only used as the leave's foreign key
+    employee_fields = ('id', 'user_id')
 
     def get_form(self, form_class=None):
         form = super().get_form(form_class)
-        employee = Employee.objects.get(user=self.request.user)
-        form.initial['employee'] = employee
+        form.initial['employee'] = self.employee
         return form
 
     def form_valid(self, form):
-        form.instance.employee = Employee.objects.get(user=self.request.user)
+        form.instance.employee = self.employee
         form.instance.status = 'PENDING'
         messages.success(self.request, 'Leave request submitted successfully.')
         return super().form_valid(form)
@@ -764,25 +831,35 @@ class EmployeeLeaveCreateView(LoginRequiredMixin, CreateView):
 class EmployeeAttendanceListView(EmployeeRequiredMixin, ListView):
     template_name = 'employee_predictor/employee_portal/attendance_list.html'
     context_object_name = 'attendances'
-    paginate_by = 31
+    # Not paginated: the list is always one month, and (employee, date) is
+    # unique, so it never holds more than 31 rows. This saves the paginator's
+    # COUNT and any OFFSET scan.
+
+    # Columns the list template renders
+    list_fields = ('date', 'status', 'check_in', 'check_out', 'hours_worked', 'notes')
 
     def get_queryset(self):
-        try:
-            employee = Employee.objects.get(user=self.request.user)
-            queryset = Attendance.objects.filter(employee=employee)
+        # Filter through the user join instead of fetching the Employee first;
+        # a user without an employee record simply gets no rows
+        queryset = Attendance.objects.filter(
+            employee__user=self.request.user
+        ).only(*self.list_fields)
 
-            month = self.request.GET.get('month')
-            year = self.request.GET.get('year')
+        month = self.request.GET.get('month')
+        year = self.request.GET.get('year')
 
-            if month and year:
-                queryset = queryset.filter(date__month=month, date__year=year)
-            else:
-                today = timezone.now()
-                queryset = queryset.filter(date__month=today.month, date__year=today.year)
+        if month and year:
+            try:
+                month_range = _month_range(int(year), int(month))
+            except ValueError:
+                # Not a real month, so nothing matches
+                return queryset.none()
+        else:
+            today = timezone.now()
+            month_range = _month_range(today.year, today.month)
 
-            return queryset.order_by('-date')
-        except Employee.DoesNotExist:
-            return Attendance.objects.none()
+        # A date range is read straight off the (employee, date) index
+        return queryset.filter(date__range=month_range).order_by('-date')
 
 
 class EmployeePayslipListView(EmployeeRequiredMixin, ListView):
@@ -791,14 +868,11 @@ class EmployeePayslipListView(EmployeeRequiredMixin, ListView):
     paginate_by = 12
 
     def get_queryset(self):
-        try:
-            employee = Employee.objects.get(user=self.request.user)
-            return Payroll.objects.filter(
-                employee=employee,
-                status__in=['APPROVED', 'PAID']
-            ).order_by('-period_end')
-        except Employee.DoesNotExist:
-            return Payroll.objects.none()
+        # Filter through the user join, as EmployeeAttendanceListView does
+        return Payroll.objects.filter(
+            employee__user=self.request.user,
+            status__in=['APPROVED', 'PAID']
+        ).order_by('-period_end')
 
 
 class EmployeePayslipDetailView(EmployeeRequiredMixin, DetailView):
@@ -807,11 +881,9 @@ class EmployeePayslipDetailView(EmployeeRequiredMixin, DetailView):
     context_object_name = 'payslip'
 
     def get_queryset(self):
-        try:
-            employee = Employee.objects.get(user=self.request.user)
-            return Payroll.objects.filter(employee=employee)
-        except Employee.DoesNotExist:
-            return Payroll.objects.none()
+        return Payroll.objects.filter(
+            employee__user=self.request.user
+        ).select_related('employee')
 
 
 class EmployeeProfileView(EmployeeRequiredMixin, DetailView):
@@ -819,7 +891,9 @@ class EmployeeProfileView(EmployeeRequiredMixin, DetailView):
     context_object_name = 'employee'
 
     def get_object(self):
-        return get_object_or_404(Employee, user=self.request.user)
+        if self.employee is None:
+            raise Http404('No employee record found for your account.')
+        return self.employee
 
 
 # Admin Function-Based Views
@@ -856,8 +930,10 @@ def approve_leave(request, pk):
 
 
 @staff_member_required
+@transaction.atomic
 def process_payroll(request, pk):
-    payroll = get_object_or_404(Payroll, pk=pk)
+    # Lock the row so a repeated request waits and then sees it approved
+    payroll = get_object_or_404(Payroll.objects.select_for_update(), pk=pk)
     if payroll.status == 'DRAFT':
         payroll.status = 'APPROVED'
         payroll.payment_date = timezone.now().date()
@@ -866,6 +942,12 @@ def process_payroll(request, pk):
     return redirect('payroll-detail', pk=payroll.pk)
 
 
+# Columns every bulk attendance CSV must have
+BULK_ATTENDANCE_COLUMNS = frozenset({'employee_id', 'status'})
+# Row errors spelled out in the upload's summary message
+BULK_ATTENDANCE_ERRORS_SHOWN = 5
+
+
 @staff_member_required
 def bulk_attendance_upload(request):
     if request.method == 'POST':
@@ -873,32 +955,87 @@ def bulk_attendance_upload(request):
         if form.is_valid():
             try:
                 date = form.cleaned_data['date']
-                df = pd.read_csv(request.FILES['csv_file'])
+                # Plain rows of strings; utf-8-sig drops the BOM Excel writes
+                reader = csv.DictReader(
+                    io.TextIOWrapper(request.FILES['csv_file'].file, encoding='utf-8-sig')
+                )
+                missing = BULK_ATTENDANCE_COLUMNS.difference(reader.fieldnames or ())
+                if missing:
+                    raise ValueError(f"missing column(s): {', '.join(sorted(missing))}")
+                rows = list(reader)
                 success_count = 0
-                error_count = 0
+                errors = []
 
-                for _, row in df.iterrows():
+                # One query each for the employees in the file and for the
+                # records they already have on this date
+                emp_map = dict(
+                    Employee.objects.filter(emp_id__in={(row['employee_id'] or '').strip() for row in rows})
+                    .order_by().values_list('emp_id', 'pk')
+                )
+                existing = dict(
+                    Attendance.objects.filter(date=date, employee_id__in=emp_map.values())
+                    .order_by().values_list('employee_id', 'pk')
+                )
+
+                # Later rows for the same employee win, as with update_or_create
+                records = {}
+                now = timezone.now()
+                # Line numbers as a spreadsheet shows them, after the header
+                for line, row in enumerate(rows, start=2):
                     try:
-                        employee = Employee.objects.get(emp_id=row['employee_id'])
-                        Attendance.objects.update_or_create(
-                            employee=employee,
+                        emp_id = (row['employee_id'] or '').strip()
+                        employee_pk = emp_map.get(emp_id)
+                        if employee_pk is None:
+                            raise Employee.DoesNotExist(f'Employee {emp_id} not found')
+
+                        # Empty cells mean no value; check_in/check_out/notes
+                        # are optional columns
+                        attendance = Attendance(
+                            pk=existing.get(employee_pk),
+                            employee_id=employee_pk,
                             date=date,
-                            defaults={
-                                'status': row['status'].upper(),
-                                'check_in': row.get('check_in'),
-                                'check_out': row.get('check_out'),
-                                'notes': row.get('notes', '')
-                            }
+                            status=(row['status'] or '').strip().upper(),
+                            check_in=row.get('check_in') or None,
+                            check_out=row.get('check_out') or None,
+                            notes=row.get('notes') or '',
+                            updated_at=now
                         )
+                        # Same checks and derived hours as Attendance.save(); the
+                        # employee is known to exist and the (employee, date)
+                        # conflict is resolved by updating the existing row
+                        attendance.full_clean(exclude=['employee'], validate_unique=False)
+                        attendance.apply_status_rules()
+                        records[employee_pk] = attendance
                         success_count += 1
                     except Exception as e:
-                        error_count += 1
-                        messages.error(request, f'Error processing record: {str(e)}')
+                        errors.append(f'line {line}: {e}')
+
+                to_update = [a for a in records.values() if a.pk is not None]
+                to_create = [a for a in records.values() if a.pk is None]
+                with transaction.atomic():
+                    Attendance.objects.bulk_create(to_create, batch_size=1000)
+                    Attendance.objects.bulk_update(
+                        to_update,
+                        ['status', 'check_in', 'check_out', 'notes', 'hours_worked', 'updated_at'],
+                        batch_size=1000
+                    )
+
+                # Bulk writes skip the post_save signals that keep these current
+                if records:
+                    invalidate_dashboard_cache()
+                    for employee_pk in records:
+                        invalidate_attendance_cache(employee_pk)
 
                 if success_count > 0:
                     messages.success(request, f'Successfully processed {success_count} attendance records.')
-                if error_count > 0:
-                    messages.warning(request, f'Failed to process {error_count} records.')
+                if errors:
+                    # One message for the whole file; each is stored in the
+                    # session, so a bad file shouldn't add one per row
+                    shown = '; '.join(errors[:BULK_ATTENDANCE_ERRORS_SHOWN])
+                    more = len(errors) - BULK_ATTENDANCE_ERRORS_SHOWN
+                    if more > 0:
+                        shown += f' (and {more} more)'
+                    messages.warning(request, f'Failed to process {len(errors)} records: {shown}')
 
                 return redirect('attendance-list')
             except Exception as e:
@@ -943,6 +1080,9 @@ class LeaveListView(StaffRequiredMixin, ListView):
     template_name = 'employee_predictor/leave_list.html'
     context_object_name = 'leaves'
     paginate_by = 10
+    # pending_count stops at this many, with pending_count_capped set so a
+    # display can show "100+"; nothing needs an exact figure past it
+    pending_count_cap = 100
 
     def get_queryset(self):
         queryset = Leave.objects.select_related('employee', 'approved_by').order_by('-start_date')
@@ -953,7 +1093,21 @@ class LeaveListView(StaffRequiredMixin, ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['pending_count'] = Leave.objects.filter(status='PENDING').count()
+        paginator = context['paginator']
+        if self.request.GET.get('status', '').upper() == 'PENDING' and paginator is not None:
+            # The paginator has already counted exactly these rows
+            context['pending_count'] = paginator.count
+            context['pending_count_capped'] = False
+        else:
+            # COUNT over a LIMIT subquery reads at most one row past the cap
+            # from the (status, start_date) index
+            pending = cache.get_or_set(
+                dashboard_cache_key(timezone.now().date(), 'pending_leaves'),
+                lambda: Leave.objects.filter(status='PENDING')[:self.pending_count_cap + 1].count(),
+                DASHBOARD_CACHE_TIMEOUT
+            )
+            context['pending_count'] = min(pending, self.pending_count_cap)
+            context['pending_count_capped'] = pending > self.pending_count_cap
         return context
 
 
@@ -998,11 +1152,12 @@ class AttendanceListView(StaffRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         today = timezone.now().date()
-        context['today_stats'] = Attendance.objects.filter(date=today).aggregate(
-            present=Count('id', filter=Q(status='PRESENT')),
-            absent=Count('id', filter=Q(status='ABSENT')),
-            late=Count('id', filter=Q(status='LATE')),
-            on_leave=Count('id', filter=Q(status='ON_LEAVE'))
+        context['today_stats'] = cache.get_or_set(
+            dashboard_cache_key(today, 'attendance'),
+            lambda: attendance_stats(
+                attendance_status_counts(Attendance.objects.filter(date=today))
+            ),
+            DASHBOARD_CACHE_TIMEOUT
         )
         return context
 
@@ -1043,21 +1198,48 @@ class PayrollListView(StaffRequiredMixin, ListView):
     template_name = 'employee_predictor/payroll_list.html'
     context_object_name = 'payrolls'
     paginate_by = 10
+    paginator_class = KnownCountPaginator
+
+    # Columns the list template renders; of the wide employee row only the
+    # name is shown
+    list_fields = (
+        'period_start', 'period_end', 'basic_salary', 'overtime_hours', 'overtime_rate',
+        'deductions', 'tax', 'net_salary', 'status', 'employee__name',
+    )
 
     def get_queryset(self):
-        queryset = Payroll.objects.select_related('employee').order_by('-period_end')
+        queryset = Payroll.objects.select_related('employee').only(
+            *self.list_fields
+        ).order_by('-period_end')
         month = self.request.GET.get('month')
         year = self.request.GET.get('year')
         if month and year:
-            queryset = queryset.filter(period_start__month=month, period_start__year=year)
+            try:
+                month_range = _month_range(int(year), int(month))
+            except ValueError:
+                # Not a real month, so nothing matches
+                return queryset.none()
+            # A plain range on period_start can use its index; MONTH() can't
+            queryset = queryset.filter(period_start__range=month_range)
         return queryset
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['total_payroll'] = self.get_queryset().aggregate(
+    @cached_property
+    def total_payroll(self):
+        # Totals over the filtered list the ListView already built
+        return self.object_list.aggregate(
             total=Sum('net_salary'),
             count=Count('id')
         )
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        # The totals aggregate already counts the filtered rows
+        return super().get_paginator(
+            queryset, per_page, count=self.total_payroll['count'], **kwargs
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['total_payroll'] = self.total_payroll
         return context
 
 
@@ -1075,20 +1257,23 @@ class PayrollCreateView(StaffRequiredMixin, CreateView):
                 context['employee'] = employee
                 # Calculate default values based on attendance
                 today = timezone.now().date()
-                month_start = today.replace(day=1)
-                month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+                month_start, month_end = _month_range(today.year, today.month)
 
-                attendance = Attendance.objects.filter(
+                # Days and hours in one aggregate over the month's present rows
+                summary = Attendance.objects.filter(
                     employee=employee,
                     date__range=[month_start, month_end],
                     status='PRESENT'
+                ).aggregate(
+                    total_hours=Sum('hours_worked'),
+                    working_days=Count('id')
                 )
-                total_hours = attendance.aggregate(Sum('hours_worked'))['hours_worked__sum'] or 0
-                regular_hours = attendance.count() * 8
+                total_hours = summary['total_hours'] or 0
+                regular_hours = summary['working_days'] * 8
                 overtime_hours = max(0, total_hours - regular_hours)
 
                 context['attendance_summary'] = {
-                    'working_days': attendance.count(),
+                    'working_days': summary['working_days'],
                     'total_hours': total_hours,
                     'overtime_hours': overtime_hours
                 }
@@ -1106,27 +1291,32 @@ class PayrollCreateView(StaffRequiredMixin, CreateView):
 
 class PayrollDetailView(StaffRequiredMixin, DetailView):
     model = Payroll
+    queryset = Payroll.objects.select_related('employee')
     template_name = 'employee_predictor/payroll_detail.html'
     context_object_name = 'payroll'
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        payroll = self.get_object()
+        payroll = self.object
 
         # Get attendance records for payroll period
-        context['attendance_records'] = Attendance.objects.filter(
-            employee=payroll.employee,
+        records = list(Attendance.objects.filter(
+            employee_id=payroll.employee_id,
             date__range=[payroll.period_start, payroll.period_end]
-        ).order_by('date')
-
-        # Calculate attendance statistics
-        context['attendance_stats'] = context['attendance_records'].aggregate(
-            present_days=Count('id', filter=Q(status='PRESENT')),
-            absent_days=Count('id', filter=Q(status='ABSENT')),
-            late_days=Count('id', filter=Q(status='LATE')),
-            leave_days=Count('id', filter=Q(status='ON_LEAVE')),
-            total_hours=Sum('hours_worked')
-        )
+        ).order_by('date'))
+        context['attendance_records'] = records
+
+        # Calculate attendance statistics from the rows already fetched
+        status_counts = Counter(record.status for record in records)
+        hours = [record.hours_worked for record in records if record.hours_worked is not None]
+        context['attendance_stats'] = {
+            'present_days': status_counts['PRESENT'],
+            'absent_days': status_counts['ABSENT'],
+            'late_days': status_counts['LATE'],
+            'leave_days': status_counts['ON_LEAVE'],
+            # Sum('hours_worked') semantics: None when no hours are recorded
+            'total_hours': sum(hours) if hours else None,
+        }
 
         return context
 
@@ -1158,23 +1348,32 @@ def approve_leave(request, pk):
     action = request.GET.get('action')
 
     if action == 'approve' and leave.status != 'APPROVED':
-        leave.status = 'APPROVED'
-        leave.approved_by = request.user
-        leave.save()
-
-        # Create attendance records for approved leave
-        current_date = leave.start_date
-        while current_date <= leave.end_date:
-            # Check if record already exists
-            Attendance.objects.get_or_create(
-                employee=leave.employee,
-                date=current_date,
-                defaults={
-                    'status': 'ON_LEAVE',
-                    'notes': f"On {leave.leave_type}"
-                }
+        # Create attendance records for approved leave in one INSERT;
+        # bulk_create skips Attendance.save(), so set the zero hours it
+        # would assign to ON_LEAVE rows, and ignore_conflicts keeps days
+        # that already have a record, as get_or_create did
+        notes = f"On {leave.leave_type}"
+        rows = (
+            Attendance(
+                # employee_id rather than employee, which would load the Employee
+                employee_id=leave.employee_id,
+                date=leave.start_date + timedelta(days=i),
+                status='ON_LEAVE',
+                hours_worked=Decimal('0.00'),
+                notes=notes
             )
-            current_date += timedelta(days=1)
+            for i in range((leave.end_date - leave.start_date).days + 1)
+        )
+
+        with transaction.atomic():
+            leave.status = 'APPROVED'
+            leave.approved_by = request.user
+            leave.save()
+            Attendance.objects.bulk_create(rows, batch_size=500, ignore_conflicts=True)
+
+        # bulk_create sends no post_save, so drop the cached stats here
+        invalidate_attendance_cache(leave.employee_id)
+        invalidate_dashboard_cache()
 
         messages.success(request, 'Leave request approved successfully.')
 
@@ -93,6 +93,17 @@ DATABASES = {
     }
 }
 
+# Shared cache. The dashboard, department and attendance caches are
+# invalidated by bumping version keys from signal handlers, so every worker
+# process has to read the same store; a per-process LocMemCache would keep
+# serving stale entries on the workers that did not handle the write.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://127.0.0.1:6379/1',
+    }
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -0,0 +1,38 @@
+"""
+Test settings for hr_analytics.
+
+Used by the test runner via ``--settings=hr_analytics.test_settings``.
+"""
+from .settings import *  # noqa: F401,F403
+
+# PBKDF2 is deliberately slow; tests only need passwords to round-trip.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# No test exercises lockouts; skip axes' per-attempt bookkeeping.
+AXES_ENABLED = False
+AXES_HANDLER = 'axes.handlers.dummy.AxesDummyHandler'
+
+# Keep the test database in memory. The test runner creates it once per
+# process (and once per xdist worker), so nothing is ever written to disk.
+# Django creates SQLite foreign keys DEFERRABLE INITIALLY DEFERRED, so fixture
+# bulk inserts are not checked row by row; `PRAGMA foreign_keys = OFF` would
+# be a no-op anyway inside the transaction TestCase wraps around each class.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        'TEST': {
+            'NAME': ':memory:',
+        },
+    }
+}
+
+# Cached aggregates would outlive the per-test transaction rollback, so tests
+# run without a cache unless they override CACHES themselves.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+}
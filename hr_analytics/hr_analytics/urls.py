@@ -10,8 +10,11 @@ from employee_predictor import views
 
 
 def root_redirect(request):
-    if request.user.is_authenticated:
-        if request.user.is_staff:
+    # request.user is lazy; bind it once (anonymous visitors without a
+    # session never load a user at all)
+    user = request.user
+    if user.is_authenticated:
+        if user.is_staff:
             return redirect('dashboard')
         return redirect('employee-portal')
     return redirect('login')
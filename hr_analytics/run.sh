@@ -1,11 +1,9 @@
 #!/bin/bash
 
 # Run the tests__ after applying fixes
+# pytest.ini runs the suite under pytest-xdist (-n auto --dist=loadfile) with
+# hr_analytics.test_settings; pytest-cov merges the per-worker coverage data.
 echo "Running tests after fixing test files..."
-coverage run --source='employee_predictor' manage.py test employee_predictor.tests
-
-# Generate coverage report
-echo "Generating coverage report..."
-coverage report
+pytest employee_predictor/tests --cov --cov-report=term
 
 echo "Tests should now be passing!"
\ No newline at end of file